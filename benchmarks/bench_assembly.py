@@ -0,0 +1,92 @@
+"""Compare the vectorised Helmholtz assembly with a cell by cell loop
+inserting into a :class:`scipy.sparse.lil_matrix`.
+"""
+
+from fe_utils import *
+from fe_utils.assembly import assemble_matrix
+import numpy as np
+import scipy.sparse as sp
+from argparse import ArgumentParser
+from time import perf_counter
+
+
+def assemble_loop(fs):
+    """Assemble the Helmholtz matrix one cell at a time."""
+
+    fe = fs.element
+    mesh = fs.mesh
+    Q = gauss_quadrature(fe.cell, 2 * fe.degree)
+    phi = fe.tabulate(Q.points)
+    dphi = fe.tabulate(Q.points, grad=True)
+
+    A = sp.lil_matrix((fs.node_count, fs.node_count))
+
+    for c in range(mesh.entity_counts[-1]):
+        nodes = fs.cell_nodes[c, :]
+        J = mesh.jacobian(c)
+        invJ = np.linalg.inv(J)
+        detJ = np.abs(np.linalg.det(J))
+
+        grad = np.einsum("qid,de->qie", dphi, invJ)
+        A[np.ix_(nodes, nodes)] += (
+            np.einsum("qid,qjd,q->ij", grad, grad, Q.weights)
+            + np.einsum("qi,qj,q->ij", phi, phi, Q.weights)
+        ) * detJ
+
+    return A.tocsr()
+
+
+if __name__ == "__main__":
+
+    parser = ArgumentParser(
+        description="""Time the assembly of the Helmholtz matrix."""
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=10,
+        help="The number of reassemblies used to time pattern reuse.",
+    )
+    parser.add_argument(
+        "resolution",
+        type=int,
+        nargs=1,
+        help="The number of cells in each direction on the mesh.",
+    )
+    parser.add_argument(
+        "degree",
+        type=int,
+        nargs=1,
+        help="The degree of the polynomial basis for the function space.",
+    )
+    args = parser.parse_args()
+
+    mesh = UnitSquareMesh(args.resolution[0], args.resolution[0])
+    fs = FunctionSpace(mesh, LagrangeElement(mesh.cell, args.degree[0]))
+
+    start = perf_counter()
+    A = assemble_matrix(fs)
+    vectorised = perf_counter() - start
+
+    start = perf_counter()
+    B = assemble_loop(fs)
+    loop = perf_counter() - start
+
+    print("Cells:      %d" % mesh.entity_counts[-1])
+    print("Vectorised: %.3fs" % vectorised)
+    print("Loop:       %.3fs" % loop)
+    print("Speedup:    %.1fx" % (loop / vectorised))
+    print("Max difference: %.3g" % abs(A - B).max())
+
+    # Repeated reassembly of the same operator reuses the sparsity pattern
+    # built by the first call above.
+    start = perf_counter()
+    for i in range(args.repeat):
+        assemble_matrix(fs)
+    reassembly = perf_counter() - start
+
+    pattern = fs.sparsity()
+    print("%s" % pattern)
+    print("Pattern setup:  %.3fs" % pattern.setup_time)
+    print("Reassembly:     %.3fs per matrix" % (reassembly / args.repeat))
+    print("Time saved:     %.3fs" % pattern.time_saved)
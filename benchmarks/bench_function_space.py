@@ -0,0 +1,42 @@
+"""Time the global numbering of FunctionSpace for a range of degrees."""
+
+from fe_utils import UnitSquareMesh, LagrangeElement, FunctionSpace
+from argparse import ArgumentParser
+from time import perf_counter
+
+
+if __name__ == "__main__":
+
+    parser = ArgumentParser(
+        description="""Time the construction of FunctionSpace.cell_nodes on a
+unit square mesh."""
+    )
+    parser.add_argument(
+        "resolution",
+        type=int,
+        nargs=1,
+        help="The number of cells in each direction on the mesh.",
+    )
+    parser.add_argument(
+        "degrees",
+        type=int,
+        nargs="+",
+        help="The degrees of the polynomial basis to time.",
+    )
+    args = parser.parse_args()
+
+    mesh = UnitSquareMesh(args.resolution[0], args.resolution[0])
+    print("Cells: %d" % mesh.entity_counts[-1])
+    print("%6s %12s %12s %12s" % ("degree", "nodes", "time", "MB"))
+
+    for degree in args.degrees:
+        fe = LagrangeElement(mesh.cell, degree)
+
+        start = perf_counter()
+        fs = FunctionSpace(mesh, fe)
+        elapsed = perf_counter() - start
+
+        print(
+            "%6d %12d %11.3fs %12.1f"
+            % (degree, fs.node_count, elapsed, fs.cell_nodes.nbytes / 2**20)
+        )
@@ -0,0 +1,79 @@
+"""Time the construction of the mesh topology as the mesh is refined."""
+
+from fe_utils import Mesh, UnitSquareMesh
+import numpy as np
+import itertools
+from argparse import ArgumentParser
+from time import perf_counter
+
+
+def edges_loop(cell_vertices):
+    """Number the edges of a triangle mesh using Python sets and dicts."""
+
+    cell_vertices = np.sort(cell_vertices)
+    edge_vertices = np.array(
+        list(
+            set(
+                tuple(sorted(e))
+                for t in cell_vertices
+                for e in itertools.combinations(t, 2)
+            )
+        )
+    )
+    edge_dict = {
+        tuple(e): i
+        for i, e_ in enumerate(edge_vertices)
+        for e in (e_, reversed(e_))
+    }
+    local_edge_vertices = np.array([[1, 2], [0, 2], [0, 1]])
+
+    return edge_vertices, np.fromiter(
+        (
+            edge_dict[tuple(t.take(local_edge_vertices[e]))]
+            for t in cell_vertices
+            for e in range(3)
+        ),
+        dtype=np.int32,
+        count=cell_vertices.size,
+    ).reshape((-1, 3))
+
+
+if __name__ == "__main__":
+
+    parser = ArgumentParser(
+        description="""Time mesh construction on a sequence of unit square
+meshes."""
+    )
+    parser.add_argument(
+        "resolutions",
+        type=int,
+        nargs="+",
+        help="The numbers of cells in each direction on the meshes.",
+    )
+    parser.add_argument(
+        "--loop",
+        action="store_true",
+        help="Also time the set and dict based edge numbering.",
+    )
+    args = parser.parse_args()
+
+    print("%10s %15s %12s %12s" % ("cells", "UnitSquareMesh", "Mesh", "loop"))
+    for n in args.resolutions:
+        start = perf_counter()
+        square = UnitSquareMesh(n, n)
+        structured = perf_counter() - start
+
+        start = perf_counter()
+        Mesh(square.vertex_coords, square.cell_vertices)
+        vectorised = perf_counter() - start
+
+        loop = "-"
+        if args.loop:
+            start = perf_counter()
+            edges_loop(square.cell_vertices)
+            loop = "%.3fs" % (perf_counter() - start)
+
+        print(
+            "%10d %14.3fs %11.3fs %12s"
+            % (square.entity_counts[-1], structured, vectorised, loop)
+        )
@@ -8,3 +8,4 @@ from .finite_elements import FiniteElement, LagrangeElement  # NOQA F401
 from .function_spaces import FunctionSpace, Function  # NOQA F401
 from .quadrature import gauss_quadrature  # NOQA F401
 from .utils import errornorm  # NOQA F401
+from .assembly import assemble_matrix, assemble_vector  # NOQA F401
@@ -1,27 +1,235 @@
+import os
 import numpy as np
+from collections import OrderedDict
+from numpy.polynomial import legendre
+from scipy.special import comb
 from .reference_elements import ReferenceInterval, ReferenceTriangle
+from .utils import evaluate_at_points
+from .quadrature import gauss_quadrature
 
 np.seterr(invalid="ignore", divide="ignore")
 
 
-def lagrange_points(cell, degree):
-    """Construct the locations of the equispaced Lagrange nodes on cell.
+#: The optimised blending parameters of the warp and blend nodes on the
+#: triangle for degrees 1 to 15, from Hesthaven and Warburton, "Nodal
+#: Discontinuous Galerkin Methods", Springer, 2008.
+_warp_blend_alpha = (
+    0.0, 0.0, 1.4152, 0.1001, 0.2751, 0.9800, 1.0999, 1.2832,
+    1.3648, 1.4773, 1.4959, 1.5743, 1.5770, 1.6223, 1.6258,
+)
+
+
+def _gll_warp(degree, r):
+    """Evaluate at r in [-1, 1] the polynomial interpolating the
+    displacement from the equispaced points to the Gauss-Lobatto-Legendre
+    points of the given degree."""
+
+    gll = np.concatenate(
+        ([-1.0], legendre.Legendre.basis(degree).deriv().roots(), [1.0])
+    )
+    equispaced = np.linspace(-1.0, 1.0, degree + 1)
+
+    # Interpolate in the Legendre basis, which is well conditioned.
+    coefs = np.linalg.solve(
+        legendre.legvander(equispaced, degree), gll - equispaced
+    )
+    return legendre.legval(r, coefs)
+
+
+def lagrange_points(cell, degree, variant="equispaced"):
+    """Construct the locations of the Lagrange nodes on cell.
 
     :param cell: the :class:`~.reference_elements.ReferenceCell`
     :param degree: the degree of polynomials for which to construct nodes.
+    :param variant: the node family. ``"equispaced"`` nodes lie on a
+        regular lattice. ``"gll"`` nodes are the Gauss-Lobatto-Legendre
+        points on the interval and the warp and blend points of Warburton
+        on the triangle, whose edge nodes are Gauss-Lobatto-Legendre
+        points. The latter keep interpolation well conditioned at high
+        degree.
 
     :returns: a rank 2 :class:`~numpy.array` whose rows are the
         coordinates of the nodes.
 
-    The implementation of this function is left as an :ref:`exercise
-    <ex-lagrange-points>`.
-
+    The nodes are listed entity by entity in ascending order of entity
+    dimension: first the vertices, then the nodes interior to each edge
+    (in the direction of the edge) and finally those interior to the cell.
+    Both variants use the same ordering.
     """
 
-    raise NotImplementedError
-
+    points = []
+    for d in range(cell.dim + 1):
+        # The lattice points strictly interior to a d-dimensional entity
+        # are those whose d+1 barycentric indices are all at least 1.
+        interior = [
+            i
+            for i in np.ndindex(*(degree + 1,) * d)
+            if min(i, default=1) >= 1 and sum(i) <= degree - 1
+        ]
+        for vertices in cell.topology[d].values():
+            origin = cell.vertices[vertices[0]]
+            axes = cell.vertices[vertices[1:]] - origin
+            points.extend(origin + np.dot(i, axes) / degree for i in interior)
+
+    points = np.array(points, dtype=np.double)
+
+    if variant == "equispaced":
+        return points
+    elif variant != "gll":
+        raise ValueError("Unknown Lagrange variant: %s" % variant)
+
+    if cell is ReferenceInterval:
+        # The interior points are in ascending order in both families.
+        points[2:, 0] += _gll_warp(degree, 2 * points[2:, 0] - 1) / 2
+    elif cell is ReferenceTriangle:
+        # Warp and blend, expressed in barycentric coordinates.
+        L = np.stack(
+            (1 - points.sum(axis=1), points[:, 0], points[:, 1]), axis=1
+        )
+        alpha = _warp_blend_alpha[degree - 1] if degree <= 15 else 5 / 3
+
+        dL = np.zeros_like(L)
+        for k in range(3):
+            # The warp along the edge opposite vertex k, blended into the
+            # interior. The blend vanishes on the other two edges, so
+            # vertices do not move and edge nodes stay on their edges.
+            i, j = (k + 1) % 3, (k + 2) % 3
+            r = L[:, j] - L[:, i]
+            interior = np.abs(r) < 1 - 1e-10
+            warp = np.zeros(len(points))
+            warp[interior] = _gll_warp(degree, r[interior]) / (
+                1 - r[interior] ** 2
+            )
+            warp *= 4 * L[:, i] * L[:, j] * (1 + (alpha * L[:, k]) ** 2)
+            # A displacement of r along the edge moves barycentric weight
+            # r / 2 from vertex i to vertex j.
+            dL[:, i] -= warp / 2
+            dL[:, j] += warp / 2
+
+        points += dL[:, 1:]
+
+    return points
+
+
+def _jet_product(f, p):
+    """Multiply two polynomials given as jets: tuples of their values,
+    gradients and optionally Hessians evaluated at the same points."""
+    jet = [
+        f[0] * p[0],
+        f[1] * p[0][:, np.newaxis] + f[0][:, np.newaxis] * p[1],
+    ]
+    if len(f) > 2:
+        cross = f[1][:, :, np.newaxis] * p[1][:, np.newaxis, :]
+        jet.append(
+            f[2] * p[0][:, np.newaxis, np.newaxis]
+            + cross
+            + cross.transpose((0, 2, 1))
+            + f[0][:, np.newaxis, np.newaxis] * p[2]
+        )
+    return tuple(jet)
+
+
+def _jet_combination(a, p, b, q):
+    """Return a * p - b * q for polynomials given as jets."""
+    return tuple(a * x - b * y for x, y in zip(p, q))
+
+
+def _jacobi_recurrence(a, n):
+    """Return the coefficients (a_n, b_n, c_n) of the three term recurrence
+    P_{n+1} = (a_n x + b_n) P_n - c_n P_{n-1} for the Jacobi polynomials
+    with weight (1 - x)^a."""
+    an = (2 * n + 1 + a) * (2 * n + 2 + a) / (2 * (n + 1) * (n + 1 + a))
+    bn = a * a * (2 * n + 1 + a) / (2 * (n + 1) * (2 * n + a) * (n + 1 + a))
+    cn = (n + a) * n * (2 * n + 2 + a) / ((n + 1) * (n + 1 + a) * (2 * n + a))
+    return an, bn, cn
+
+
+def _orthonormal_vandermonde(cell, degree, points, order):
+    """Evaluate an orthonormal prime basis and its derivatives up to order
+    (at least 1) at points.
+
+    On the interval this is the Legendre basis. On the triangle it is the
+    Dubiner basis, evaluated with the recurrences of Kirby, "Singularity
+    free evaluation of collapsed-coordinate orthogonal polynomials", ACM
+    TOMS 37(1), 2010, which are written directly in Cartesian coordinates
+    and so are differentiated by applying the product rule at each step.
+    """
 
-def vandermonde_matrix(cell, degree, points, grad=False):
+    n = points.shape[0]
+    zeros = (np.zeros((n, cell.dim)), np.zeros((n, cell.dim, cell.dim)))
+    ones = (np.ones(n),) + zeros[:order]
+
+    def affine(a, b):
+        # The polynomial a . x + b.
+        return (points @ a + b, np.tile(a, (n, 1)).astype(np.double)) + (
+            zeros[1:order]
+        )
+
+    if cell is ReferenceInterval:
+        x = affine(np.array([2.0]), -1.0)
+        P = [ones, x]
+        for k in range(1, degree):
+            P.append(
+                _jet_combination(
+                    (2 * k + 1) / (k + 1),
+                    _jet_product(x, P[k]),
+                    k / (k + 1),
+                    P[k - 1],
+                )
+            )
+        P = P[: degree + 1]
+        scale = [np.sqrt(2 * k + 1) for k in range(degree + 1)]
+
+    elif cell is ReferenceTriangle:
+        # The collapsed coordinate recurrences on the biunit triangle,
+        # transformed to the reference triangle.
+        f1 = affine(np.array([2.0, 1.0]), -1.0)
+        f2 = _jet_product(*(affine(np.array([0.0, -1.0]), 1.0),) * 2)
+
+        P = {(0, 0): ones}
+        if degree > 0:
+            P[1, 0] = f1
+        for p in range(1, degree):
+            P[p + 1, 0] = _jet_combination(
+                (2 * p + 1) / (p + 1),
+                _jet_product(f1, P[p, 0]),
+                p / (p + 1),
+                _jet_product(f2, P[p - 1, 0]),
+            )
+        for p in range(degree):
+            P[p, 1] = _jet_product(
+                affine(np.array([0.0, 3.0 + 2 * p]), -1.0), P[p, 0]
+            )
+        for p in range(degree - 1):
+            for q in range(1, degree - p):
+                an, bn, cn = _jacobi_recurrence(2 * p + 1, q)
+                # (an * y + bn) in terms of the reference coordinates.
+                factor = affine(np.array([0.0, 2 * an]), bn - an)
+                P[p, q + 1] = _jet_combination(
+                    1.0, _jet_product(factor, P[p, q]), cn, P[p, q - 1]
+                )
+
+        # Order the columns by total degree, as for the monomials.
+        columns = [
+            (d - q, q) for d in range(degree + 1) for q in range(d + 1)
+        ]
+        P = [P[i] for i in columns]
+        # The factor of 2 accounts for the reference triangle having a
+        # quarter of the area of the biunit triangle.
+        scale = [2 * np.sqrt((p + 0.5) * (p + q + 1)) for p, q in columns]
+
+    else:
+        raise ValueError("Unknown reference cell")
+
+    return tuple(
+        np.stack([c * jet[i] for c, jet in zip(scale, P)], axis=1)
+        for i in range(order + 1)
+    )
+
+
+def vandermonde_matrix(
+    cell, degree, points, grad=False, basis="monomial", dtype=np.double
+):
     """Construct the generalised Vandermonde matrix for polynomials of the
     specified degree on the cell provided.
 
@@ -29,18 +237,212 @@ def vandermonde_matrix(cell, degree, points, grad=False):
     :param degree: the degree of polynomials for which to construct the matrix.
     :param points: a list of coordinate tuples corresponding to the points.
     :param grad: whether to evaluate the Vandermonde matrix or its gradient.
+    :param basis: the prime basis: ``"monomial"`` or ``"orthonormal"``. The
+        orthonormal basis is the Legendre basis on the interval and the
+        Dubiner basis on the triangle. It remains well conditioned at high
+        degree, where the monomial basis does not.
+    :param dtype: the floating point type of the result. Single precision
+        is adequate for plotting.
 
     :returns: the generalised :ref:`Vandermonde matrix <sec-vandermonde>`
 
-    The implementation of this function is left as an :ref:`exercise
-    <ex-vandermonde>`.
+    The columns are ordered by total degree and, within each degree, by
+    ascending power of :math:`y`. If ``grad`` is ``True`` the result has
+    shape (points, columns, dim).
+
+    See :func:`vandermonde_derivatives` to evaluate several derivatives
+    at once.
     """
 
-    raise NotImplementedError
+    order = 1 if grad else 0
+    return vandermonde_derivatives(cell, degree, points, order, basis, dtype)[
+        order
+    ]
+
+
+def vandermonde_derivatives(
+    cell, degree, points, order=1, basis="monomial", dtype=np.double
+):
+    """Evaluate the generalised Vandermonde matrix and its derivatives.
+
+    :param cell: the :class:`~.reference_elements.ReferenceCell`
+    :param degree: the degree of polynomials for which to construct the matrix.
+    :param points: a list of coordinate tuples corresponding to the points.
+    :param order: the highest order of derivative to evaluate: 0, 1 or 2.
+    :param basis: the prime basis. See :func:`vandermonde_matrix`.
+    :param dtype: the floating point type of the result.
+
+    :returns: a tuple of ``order + 1`` arrays. Entry ``k`` holds the
+        ``k``-th derivatives and has shape (points, columns) followed by
+        ``k`` axes of length dim, so the Hessian is (points, columns, dim,
+        dim).
+
+    The monomials and all their derivatives are evaluated from a single
+    table of the powers of each coordinate, built with cumulative
+    products.
+    """
+
+    if order not in (0, 1, 2):
+        raise ValueError("Derivatives of order %s not supported" % order)
+
+    points = np.asarray(points, dtype=np.double)
+
+    if basis == "orthonormal":
+        return tuple(
+            V.astype(dtype, copy=False)
+            for V in _orthonormal_vandermonde(
+                cell, degree, points, max(order, 1)
+            )[: order + 1]
+        )
+    elif basis != "monomial":
+        raise ValueError("Unknown basis: %s" % basis)
+
+    if cell is ReferenceInterval:
+        powers = np.arange(degree + 1).reshape((-1, 1))
+    elif cell is ReferenceTriangle:
+        powers = np.array(
+            [(d - p, p) for d in range(degree + 1) for p in range(d + 1)]
+        )
+    else:
+        raise ValueError("Unknown reference cell")
+
+    points = points.astype(dtype)
+    n, dim = points.shape
+
+    # table[:, k, i] is the k-th power of coordinate i at each point.
+    table = np.empty((n, degree + 1, dim), dtype=dtype)
+    table[:, 0, :] = 1.0
+    np.cumprod(
+        np.broadcast_to(points[:, np.newaxis, :], (n, degree, dim)),
+        axis=1,
+        out=table[:, 1:, :],
+    )
+
+    factors = {}
+
+    def factor(i, a):
+        # The a-th derivative with respect to x_i of the power of x_i in
+        # each monomial: p * (p - 1) * ... * x_i**(p - a). Terms with
+        # p < a pick up a zero coefficient, so the power they index is
+        # irrelevant.
+        if (i, a) not in factors:
+            coefficient = np.prod(
+                [powers[:, i] - t for t in range(a)], axis=0, dtype=int
+            )
+            lowered = np.maximum(powers[:, i] - a, 0)
+            factors[i, a] = coefficient * table[:, lowered, i]
+        return factors[i, a]
+
+    derivatives = {}
+
+    def derivative(counts):
+        # The derivative taking counts[i] derivatives in direction i.
+        if counts not in derivatives:
+            V = factor(0, counts[0])
+            for i in range(1, dim):
+                V = V * factor(i, counts[i])
+            derivatives[counts] = V
+        return derivatives[counts]
+
+    result = []
+    for k in range(order + 1):
+        V = np.empty((n, len(powers)) + (dim,) * k, dtype=dtype)
+        for index in np.ndindex(*(dim,) * k):
+            counts = tuple(np.bincount(index, minlength=dim).tolist())
+            V[(slice(None), slice(None)) + index] = derivative(counts)
+        result.append(V)
+
+    return tuple(result)
+
+
+class TabulationCache(object):
+    #: The default memory cap in bytes of a new cache.
+    default_max_bytes = 64 * 2**20
+
+    def __init__(self, max_bytes=None):
+        """A least recently used cache of basis function tabulations.
+
+        :param max_bytes: The maximum total size in bytes of the cached
+            tables. Defaults to :attr:`default_max_bytes`.
+        """
+
+        #: The maximum total size in bytes of the cached tables.
+        self.max_bytes = (
+            self.default_max_bytes if max_bytes is None else max_bytes
+        )
+        #: The total size in bytes of the cached tables.
+        self.nbytes = 0
+        #: The number of lookups which found a cached table.
+        self.hits = 0
+        #: The number of lookups which had to compute the table.
+        self.misses = 0
+        #: The number of tables discarded to respect :attr:`max_bytes`.
+        self.evictions = 0
+
+        self._tables = OrderedDict()
+
+    def lookup(self, key, compute):
+        """Return the table stored under ``key``, calling ``compute()`` to
+        create it if it is not cached. A table is an array or a tuple of
+        arrays, and is returned read only."""
+
+        if key in self._tables:
+            self.hits += 1
+            self._tables.move_to_end(key)
+            return self._tables[key][0]
+
+        self.misses += 1
+        table = compute()
+        arrays = table if isinstance(table, tuple) else (table,)
+        for a in arrays:
+            a.setflags(write=False)
+        nbytes = sum(a.nbytes for a in arrays)
+
+        if nbytes <= self.max_bytes:
+            self._tables[key] = (table, nbytes)
+            self.nbytes += nbytes
+            while self.nbytes > self.max_bytes:
+                _, (_, old) = self._tables.popitem(last=False)
+                self.nbytes -= old
+                self.evictions += 1
+
+        return table
+
+    def clear(self):
+        """Discard all cached tables."""
+        self._tables.clear()
+        self.nbytes = 0
+
+    def stats(self):
+        """Return a dictionary of the cache statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._tables),
+            "nbytes": self.nbytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def __repr__(self):
+        return "%s(%s)" % (
+            self.__class__.__name__,
+            ", ".join("%s=%s" % i for i in self.stats().items()),
+        )
 
 
 class FiniteElement(object):
-    def __init__(self, cell, degree, nodes, entity_nodes=None):
+    def __init__(
+        self,
+        cell,
+        degree,
+        nodes,
+        entity_nodes=None,
+        basis="monomial",
+        basis_coefs=None,
+    ):
         """A finite element defined over cell.
 
         :param cell: the :class:`~.reference_elements.ReferenceCell`
@@ -53,8 +455,14 @@ class FiniteElement(object):
         :param entity_nodes: a dictionary of dictionaries such that
             entity_nodes[d][i] is the list of nodes associated with
             entity `(d, i)` of dimension `d` and index `i`.
-
-        Most of the implementation of this class is left as exercises.
+        :param basis: the prime basis in which the basis functions are
+            expressed. See :func:`vandermonde_matrix`. The
+            ``"orthonormal"`` basis is required for accurate basis
+            functions at high degree.
+        :param basis_coefs: the coefficients of the basis functions with
+            respect to the prime basis, if they are already known. By
+            default they are computed by inverting the Vandermonde matrix
+            of the nodes.
         """
 
         #: The :class:`~.reference_elements.ReferenceCell`
@@ -69,6 +477,8 @@ class FiniteElement(object):
         #: A dictionary of dictionaries such that ``entity_nodes[d][i]``
         #: is the list of nodes associated with entity `(d, i)`.
         self.entity_nodes = entity_nodes
+        #: The prime basis in which the basis functions are expressed.
+        self.basis = basis
 
         if entity_nodes:
             #: ``nodes_per_entity[d]`` is the number of nodes
@@ -77,15 +487,23 @@ class FiniteElement(object):
                 [len(entity_nodes[d][0]) for d in range(cell.dim + 1)]
             )
 
-        # Replace this exception with some code which sets
-        # self.basis_coefs
-        # to an array of polynomial coefficients defining the basis functions.
-        raise NotImplementedError
+        #: The coefficients of the nodal basis functions with respect to
+        #: the prime basis. Column ``j`` defines basis function ``j``.
+        self.basis_coefs = (
+            np.linalg.inv(vandermonde_matrix(cell, degree, nodes, basis=basis))
+            if basis_coefs is None
+            else basis_coefs
+        )
 
         #: The number of nodes in this element.
         self.node_count = nodes.shape[0]
 
-    def tabulate(self, points, grad=False):
+        #: The :class:`TabulationCache` of this element.
+        self.tabulation_cache = TabulationCache()
+
+        self._reference_tensors = None
+
+    def tabulate(self, points, grad=False, hessian=False):
         """Evaluate the basis functions of this finite element at the points
         provided.
 
@@ -93,20 +511,127 @@ class FiniteElement(object):
             tabulate the basis.
         :param grad: whether to return the tabulation of the basis or the
             tabulation of the gradient of the basis.
+        :param hessian: whether to return the tabulation of the Hessian
+            of the basis instead.
 
         :result: an array containing the value of each basis function
             at each point. If `grad` is `True`, the gradient vector of
             each basis vector at each point is returned as a rank 3
             array. The shape of the array is (points, nodes) if
             ``grad`` is ``False`` and (points, nodes, dim) if ``grad``
-            is ``True``.
+            is ``True``. If ``hessian`` is ``True`` the shape is
+            (points, nodes, dim, dim).
+
+        Tabulations are cached in :attr:`tabulation_cache` keyed on the
+        point coordinates, so the result is read only.
+        """
+
+        if grad and hessian:
+            raise ValueError("Only one of grad and hessian may be set")
+        order = 2 if hessian else int(grad)
+
+        points = np.ascontiguousarray(points, dtype=np.double)
+
+        return self.tabulation_cache.lookup(
+            (points.shape, points.tobytes(), order),
+            lambda: self._tabulate(points, order),
+        )
 
-        The implementation of this method is left as an :ref:`exercise
-        <ex-tabulate>`.
+    def tabulate_all(self, points, hessian=False):
+        """Evaluate the basis functions of this finite element and their
+        gradients, and optionally Hessians, at the points provided.
 
+        :param points: a list of coordinate tuples at which to
+            tabulate the basis.
+        :param hessian: whether to also tabulate the Hessians.
+
+        :result: a tuple of the tabulation of the basis, of shape
+            (points, nodes), of the gradients, of shape (points, nodes,
+            dim), and if ``hessian`` is ``True`` of the Hessians, of shape
+            (points, nodes, dim, dim).
+
+        All of the derivatives are evaluated from a single table of
+        powers. The results are cached in :attr:`tabulation_cache` like
+        those of :meth:`tabulate`, and are read only. Repeated calls at
+        the same points return the cached arrays, so the only allocation
+        is the cache key, which is the size of ``points``.
         """
 
-        raise NotImplementedError
+        points = np.ascontiguousarray(points, dtype=np.double)
+        order = 2 if hessian else 1
+
+        return self.tabulation_cache.lookup(
+            (points.shape, points.tobytes(), "all", order),
+            lambda: self._tabulate_all(points, order),
+        )
+
+    def _tabulate_all(self, points, order):
+        V = vandermonde_derivatives(
+            self.cell, self.degree, points, order, basis=self.basis
+        )
+
+        return (np.dot(V[0], self.basis_coefs),) + tuple(
+            np.einsum("pm...,mn->pn...", dV, self.basis_coefs, optimize=True)
+            for dV in V[1:]
+        )
+
+    def _tabulate(self, points, order):
+        if order < 2:
+            V = vandermonde_matrix(
+                self.cell, self.degree, points, grad=order, basis=self.basis
+            )
+        else:
+            V = vandermonde_derivatives(
+                self.cell, self.degree, points, order, basis=self.basis
+            )[order]
+
+        if order:
+            return np.einsum("pm...,mn->pn...", V, self.basis_coefs)
+        else:
+            return np.dot(V, self.basis_coefs)
+
+    def _reference_tensor(self, name):
+        if self._reference_tensors is None:
+            Q = gauss_quadrature(self.cell, 2 * self.degree)
+            phi, dphi = self.tabulate_all(Q.points)
+            self._reference_tensors = {
+                "mass": np.einsum("q,qi,qj->ij", Q.weights, phi, phi),
+                "grad": np.einsum(
+                    "q,qid,qje->deij", Q.weights, dphi, dphi, optimize=True
+                ),
+                "value_grad": np.einsum(
+                    "q,qi,qjd->dij", Q.weights, phi, dphi, optimize=True
+                ),
+            }
+            for t in self._reference_tensors.values():
+                t.setflags(write=False)
+
+        return self._reference_tensors[name]
+
+    @property
+    def mass_matrix(self):
+        """The reference mass matrix, whose entry ``[i, j]`` is the integral
+        over the reference cell of the product of basis functions ``i``
+        and ``j``.
+
+        The reference tensors are computed together on first use and are
+        read only."""
+        return self._reference_tensor("mass")
+
+    @property
+    def gradient_products(self):
+        """The array of shape (dim, dim, nodes, nodes) whose entry
+        ``[d, e, i, j]`` is the reference integral of the product of the
+        ``d`` derivative of basis function ``i`` and the ``e`` derivative
+        of basis function ``j``."""
+        return self._reference_tensor("grad")
+
+    @property
+    def value_gradient_products(self):
+        """The array of shape (dim, nodes, nodes) whose entry ``[d, i, j]``
+        is the reference integral of the product of basis function ``i``
+        and the ``d`` derivative of basis function ``j``."""
+        return self._reference_tensor("value_grad")
 
     def interpolate(self, fn):
         """Interpolate fn onto this finite element by evaluating it
@@ -118,34 +643,129 @@ class FiniteElement(object):
         :returns: A vector containing the value of ``fn`` at each node
            of this element.
 
-        The implementation of this method is left as an :ref:`exercise
-        <ex-interpolate>`.
-
+        If ``fn`` also works on arrays of points, it is called once for all
+        of the nodes. See :func:`~.utils.evaluate_at_points`.
         """
 
-        raise NotImplementedError
+        return evaluate_at_points(fn, self.nodes)
 
     def __repr__(self):
         return "%s(%s, %s)" % (self.__class__.__name__, self.cell, self.degree)
 
 
 class LagrangeElement(FiniteElement):
-    def __init__(self, cell, degree):
-        """An equispaced Lagrange finite element.
+    #: The directory in which :meth:`get` stores the basis coefficients of
+    #: the elements it creates, so that they can be reused by other
+    #: processes. ``None`` disables the on-disk cache.
+    cache_dir = None
+
+    _registry = {}
+
+    def __init__(
+        self,
+        cell,
+        degree,
+        variant="equispaced",
+        basis="monomial",
+        basis_coefs=None,
+    ):
+        """A Lagrange finite element.
 
         :param cell: the :class:`~.reference_elements.ReferenceCell`
             over which the element is defined.
         :param degree: the
             polynomial degree of the element. We assume the element
             spans the complete polynomial space.
+        :param variant: the family of nodes. See :func:`lagrange_points`.
+        :param basis: the prime basis in which the basis functions are
+            expressed. See :func:`vandermonde_matrix`.
+        :param basis_coefs: the coefficients of the basis functions, if
+            they are already known. See :class:`FiniteElement`.
+
+        Code which only needs a standard element should use :meth:`get`,
+        which shares one instance between all its callers.
+        """
 
-        The implementation of this class is left as an :ref:`exercise
-        <ex-lagrange-element>`.
+        #: The family of nodes of this element.
+        self.variant = variant
+
+        nodes = lagrange_points(cell, degree, variant)
+
+        # lagrange_points lists the nodes entity by entity, so the nodes
+        # of each entity form a contiguous block.
+        entity_nodes = {}
+        first = 0
+        for d in range(cell.dim + 1):
+            count = round(comb(degree - 1, d))
+            entity_nodes[d] = {
+                e: list(range(first + e * count, first + (e + 1) * count))
+                for e in cell.topology[d]
+            }
+            first += count * len(cell.topology[d])
+
+        super(LagrangeElement, self).__init__(
+            cell, degree, nodes, entity_nodes, basis, basis_coefs
+        )
+
+    @classmethod
+    def get(cls, cell, degree, variant="equispaced", basis="monomial"):
+        """Return the shared Lagrange element with the given parameters,
+        creating it on first use.
+
+        The parameters are as for :class:`LagrangeElement`. The nodes and
+        basis coefficients of the shared element are read only, and its
+        tabulation cache is shared by all callers, so the element must
+        not be modified.
+
+        If :attr:`cache_dir` is set, the basis coefficients are loaded
+        from a ``.npz`` file in that directory if one exists, and saved
+        there otherwise.
         """
 
-        raise NotImplementedError
-        # Use lagrange_points to obtain the set of nodes.  Once you
-        # have obtained nodes, the following line will call the
-        # __init__ method on the FiniteElement class to set up the
-        # basis coefficients.
-        super(LagrangeElement, self).__init__(cell, degree, nodes)
+        key = (cell.name, degree, variant, basis)
+        if key not in cls._registry:
+            fe = cls._load(cell, degree, variant, basis)
+            fe.nodes.setflags(write=False)
+            fe.basis_coefs.setflags(write=False)
+            cls._registry[key] = fe
+
+        return cls._registry[key]
+
+    @classmethod
+    def _load(cls, cell, degree, variant, basis):
+        if cls.cache_dir is None:
+            return cls(cell, degree, variant, basis)
+
+        filename = os.path.join(
+            cls.cache_dir,
+            "%s_%d_%s_%s.npz" % (cell.name, degree, variant, basis),
+        )
+        nodes = lagrange_points(cell, degree, variant)
+
+        try:
+            with np.load(filename) as data:
+                # Refuse a stale cache written with different nodes.
+                if np.array_equal(data["nodes"], nodes):
+                    return cls(
+                        cell, degree, variant, basis, data["basis_coefs"]
+                    )
+        except (OSError, KeyError, ValueError):
+            pass
+
+        fe = cls(cell, degree, variant, basis)
+        # Write to a temporary file first so that concurrent processes
+        # never read a partial file.
+        tmp = "%s.%d.tmp.npz" % (filename[:-4], os.getpid())
+        try:
+            os.makedirs(cls.cache_dir, exist_ok=True)
+            np.savez(tmp, nodes=fe.nodes, basis_coefs=fe.basis_coefs)
+            os.replace(tmp, filename)
+        except OSError:
+            # The cache is only an optimisation, so failing to write it
+            # is not an error.
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+        return fe
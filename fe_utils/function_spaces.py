@@ -1,6 +1,9 @@
 import numpy as np
 from . import ReferenceTriangle, ReferenceInterval
-from .finite_elements import LagrangeElement, lagrange_points
+from .finite_elements import lagrange_points
+from .assembly import SparsityPattern
+from .quadrature import gauss_quadrature
+from .utils import evaluate_at_points
 from matplotlib import pyplot as plt
 from matplotlib.tri import Triangulation
 
@@ -14,8 +17,6 @@ class FunctionSpace(object):
         :param element: The :class:`~.finite_elements.FiniteElement` of this
             space.
 
-        Most of the implementation of this class is left as an :ref:`exercise
-        <ex-function-space>`.
         """
 
         #: The :class:`~.mesh.Mesh` on which this space is built.
@@ -23,19 +24,87 @@ class FunctionSpace(object):
         #: The :class:`~.finite_elements.FiniteElement` of this space.
         self.element = element
 
-        raise NotImplementedError
+        # The first global node associated with each entity dimension.
+        offsets = np.concatenate(
+            ([0], np.cumsum(element.nodes_per_entity * mesh.entity_counts))
+        )
+
+        cell_count = mesh.entity_counts[-1]
 
-        # Implement global numbering in order to produce the global
-        # cell node list for this space.
         #: The global cell node list. This is a two-dimensional array in
         #: which each row lists the global nodes incident to the corresponding
-        #: cell. The implementation of this member is left as an
-        #: :ref:`exercise <ex-function-space>`
-        self.cell_nodes = None
+        #: cell.
+        self.cell_nodes = np.empty(
+            (cell_count, element.node_count), dtype=np.int32
+        )
+
+        # Fill in the nodes of each local entity for all cells at once. The
+        # cell and edge vertices are both sorted, so every local edge is
+        # traversed in the same direction as the global edge it maps to and
+        # the edge nodes of neighbouring cells agree without reordering.
+        for delta in range(mesh.dim + 1):
+            n = element.nodes_per_entity[delta]
+            if delta == mesh.dim:
+                entities = np.arange(cell_count).reshape((-1, 1))
+            else:
+                entities = mesh.adjacency(mesh.dim, delta)
+            for epsilon, local in element.entity_nodes[delta].items():
+                self.cell_nodes[:, local] = (
+                    offsets[delta]
+                    + n * entities[:, epsilon : epsilon + 1]
+                    + np.arange(n)
+                )
 
         #: The total number of nodes in the function space.
         self.node_count = np.dot(element.nodes_per_entity, mesh.entity_counts)
 
+        # Sparsity patterns keyed by the trial space.
+        self._sparsity = {}
+        # The vertex coordinates from which node_coordinates was computed,
+        # and the result.
+        self._node_coordinates = (None, None)
+
+    @property
+    def node_coordinates(self):
+        """The coordinates of every node of this space, as a read only
+        (node_count, dim) array. This is computed on first use and
+        recomputed if the mesh coordinates are replaced."""
+
+        mesh = self.mesh
+        vertex_coords, coords = self._node_coordinates
+
+        if vertex_coords is not mesh.vertex_coords:
+            cg1fs = mesh.coordinate_space
+            # Map the reference nodes into every cell using the linear
+            # coordinate field.
+            coord_map = cg1fs.element.tabulate(self.element.nodes)
+            cell_coords = np.einsum(
+                "nv,cvd->cnd",
+                coord_map,
+                mesh.vertex_coords[cg1fs.cell_nodes],
+            )
+
+            coords = np.empty((self.node_count, mesh.dim))
+            coords[self.cell_nodes] = cell_coords
+            coords.setflags(write=False)
+            self._node_coordinates = (mesh.vertex_coords, coords)
+
+        return coords
+
+    def sparsity(self, column_space=None):
+        """Return the :class:`~.assembly.SparsityPattern` of matrices with
+        test functions in this space and trial functions in
+        ``column_space``. The pattern is built on first use and cached.
+
+        :param column_space: The trial :class:`FunctionSpace`. Defaults to
+            this space.
+        """
+
+        column_space = column_space or self
+        if column_space not in self._sparsity:
+            self._sparsity[column_space] = SparsityPattern(self, column_space)
+        return self._sparsity[column_space]
+
     def __repr__(self):
         return "%s(%s, %s)" % (
             self.__class__.__name__,
@@ -70,24 +139,15 @@ class Function(object):
         :class:`Function`.
 
         :param fn: A function ``fn(X)`` which takes a coordinate
-          vector and returns a scalar value.
+          vector and returns a scalar value. If ``fn`` also works on arrays
+          of points, it is called once for all of the nodes. See
+          :func:`~.utils.evaluate_at_points`.
 
         """
 
-        fs = self.function_space
-
-        # Create a map from the vertices to the element nodes on the
-        # reference cell.
-        cg1 = LagrangeElement(fs.element.cell, 1)
-        coord_map = cg1.tabulate(fs.element.nodes)
-        cg1fs = FunctionSpace(fs.mesh, cg1)
-
-        for c in range(fs.mesh.entity_counts[-1]):
-            # Interpolate the coordinates to the cell nodes.
-            vertex_coords = fs.mesh.vertex_coords[cg1fs.cell_nodes[c, :], :]
-            node_coords = np.dot(coord_map, vertex_coords)
-
-            self.values[fs.cell_nodes[c, :]] = [fn(x) for x in node_coords]
+        self.values[:] = evaluate_at_points(
+            fn, self.function_space.node_coordinates
+        )
 
     def plot(self, subdivisions=None):
         """Plot the value of this :class:`Function`. This is quite a low
@@ -126,16 +186,17 @@ class Function(object):
         function_map = fs.element.tabulate(local_coords)
 
         # Interpolation rule for coordinates.
-        cg1 = LagrangeElement(fs.element.cell, 1)
-        coord_map = cg1.tabulate(local_coords)
-        cg1fs = FunctionSpace(fs.mesh, cg1)
+        cg1fs = fs.mesh.coordinate_space
+        coord_map = cg1fs.element.tabulate(local_coords)
 
-        for c in range(fs.mesh.entity_counts[-1]):
-            vertex_coords = fs.mesh.vertex_coords[cg1fs.cell_nodes[c, :], :]
-            x = np.dot(coord_map, vertex_coords)
+        # Evaluate the coordinates and function values at the plotting
+        # points of all cells at once.
+        xs = np.einsum(
+            "pv,cvd->cpd", coord_map, fs.mesh.vertex_coords[cg1fs.cell_nodes]
+        )
+        vs = np.dot(self.values[fs.cell_nodes], function_map.T)
 
-            local_function_coefs = self.values[fs.cell_nodes[c, :]]
-            v = np.dot(function_map, local_function_coefs)
+        for x, v in zip(xs, vs):
 
             if fs.element.cell is ReferenceInterval:
 
@@ -182,9 +243,53 @@ class Function(object):
             ),
         )
 
-    def integrate(self):
+    def laplacian(self, points):
+        """Evaluate the Laplacian of this :class:`Function` on every cell,
+        as is needed for the element residuals of a posteriori error
+        estimators.
+
+        :param points: A list of coordinate tuples on the reference cell.
+        :result: An array of shape (cells, points) of the Laplacian of the
+            restriction of this :class:`Function` to each cell at the
+            image of each point.
+
+        The cells are assumed to be affine, so that the physical Hessian
+        is :math:`J^{-T} H J^{-1}` where :math:`H` is the reference
+        Hessian.
+        """
+
+        fs = self.function_space
+        H = fs.element.tabulate(points, hessian=True)
+        K = fs.mesh.inverse_jacobian_transposes
+
+        return np.einsum(
+            "ckd,cke,pnde,cn->cp",
+            K,
+            K,
+            H,
+            self.values[fs.cell_nodes],
+            optimize=True,
+        )
+
+    def integrate(self, cellwise=False):
         """Integrate this :class:`Function` over the domain.
 
-        :result: The integral (a scalar)."""
+        :param cellwise: If ``True``, return the integral over each cell
+            instead, for instance to compute error indicators.
+        :result: The integral (a scalar), or an array of the integrals
+            over each cell."""
+
+        fs = self.function_space
+        fe = fs.element
+
+        # The integral of each basis function over the reference cell.
+        Q = gauss_quadrature(fe.cell, fe.degree, "symmetric")
+        basis_integrals = np.dot(Q.weights, fe.tabulate(Q.points))
+
+        integrals = np.dot(self.values[fs.cell_nodes], basis_integrals)
+        integrals *= np.abs(fs.mesh.jacobian_determinants)
 
-        raise NotImplementedError
+        if cellwise:
+            return integrals
+        # numpy sums contiguous arrays pairwise, limiting rounding error.
+        return float(np.sum(integrals))
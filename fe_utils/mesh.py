@@ -1,6 +1,4 @@
-from scipy.spatial import Delaunay
 import numpy as np
-import itertools
 from .reference_elements import ReferenceTriangle, ReferenceInterval
 
 
@@ -8,12 +6,14 @@ class Mesh(object):
     """A one or two dimensional mesh composed of intervals or triangles
     respectively."""
 
-    def __init__(self, vertex_coords, cell_vertices):
+    def __init__(self, vertex_coords, cell_vertices, structure=None):
         """
         :param vertex_coords: a vertex_count x dim array of the coordinates of
           the vertices in the mesh.
         :param cell_vertices: a cell_count x (dim+1) array of the
           indices of the vertices of which each cell is made up.
+        :param structure: an optional dictionary of metadata describing a
+          structured mesh. See :attr:`structure`.
         """
 
         self.dim = vertex_coords.shape[1]
@@ -24,46 +24,44 @@ class Mesh(object):
         if self.dim not in (1, 2):
             raise ValueError("Only 1D and 2D meshes are supported")
 
-        self.vertex_coords = vertex_coords
-        """The coordinates of all the vertices in the mesh."""
-
         self.cell_vertices = np.sort(cell_vertices)
         """The indices of the vertices incident to cell."""
 
-        if self.dim == 2:
-            self.edge_vertices = np.array(
-                list(
-                    set(
-                        tuple(sorted(e))
-                        for t in cell_vertices
-                        for e in itertools.combinations(t, 2)
-                    )
-                )
-            )
-            """The indices of the vertices incident to edge (only for 2D
-            meshes)."""
+        self.vertex_coords = vertex_coords
 
-            # Invert self.edge_vertices so that it is possible to look up
-            # the edge index given the vertex indices.
-            edge_dict = {
-                tuple(e): i
-                for i, e_ in enumerate(self.edge_vertices)
-                for e in (e_, reversed(e_))
-            }
+        self.structure = structure
+        """Metadata describing the layout of a structured mesh, or ``None``
+        for an unstructured mesh. If the dictionary contains a
+        ``"period"`` then each cell ``c`` is a translate of cell
+        ``c % period`` with the same local vertex ordering, so the cell
+        geometry can be computed in closed form from the first ``period``
+        cells. The structure is discarded if the vertex coordinates are
+        replaced."""
 
+        if self.dim == 2:
             # List the local vertex indices associated with
             # each local edge index.
             local_edge_vertices = np.array([[1, 2], [0, 2], [0, 1]])
 
-            self.cell_edges = np.fromiter(
-                (
-                    edge_dict[tuple(t.take(local_edge_vertices[e]))]
-                    for t in self.cell_vertices
-                    for e in range(3)
-                ),
-                dtype=np.int32,
-                count=self.cell_vertices.size,
-            ).reshape((-1, 3))
+            # As the cell vertices are sorted, so are the vertex pairs of
+            # each local edge. Encoding each pair as a single integer
+            # allows the distinct edges to be found with np.unique, which
+            # also numbers them in lexicographic order of their vertices.
+            pairs = self.cell_vertices[:, local_edge_vertices]
+            vertex_count = vertex_coords.shape[0]
+            edges, cell_edges = np.unique(
+                pairs[:, :, 0].astype(np.int64) * vertex_count
+                + pairs[:, :, 1],
+                return_inverse=True,
+            )
+
+            self.edge_vertices = np.stack(
+                (edges // vertex_count, edges % vertex_count), axis=1
+            )
+            """The indices of the vertices incident to edge (only for 2D
+            meshes)."""
+
+            self.cell_edges = cell_edges.reshape((-1, 3)).astype(np.int32)
             """The indices of the edges incident to each cell (only for 2D
             meshes)."""
 
@@ -87,6 +85,196 @@ class Mesh(object):
         #: :class:`Mesh` is composed.
         self.cell = (0, ReferenceInterval, ReferenceTriangle)[self.dim]
 
+        self._coordinate_space = None
+        self._exterior_facets = None
+        self._csr_adjacency = {}
+
+    @property
+    def coordinate_space(self):
+        """The degree 1 Lagrange
+        :class:`~.function_spaces.FunctionSpace` on this mesh, whose
+        nodes are the vertices. It is created on first use and shared by
+        everything that maps reference coordinates into the mesh."""
+
+        if self._coordinate_space is None:
+            from .finite_elements import LagrangeElement
+            from .function_spaces import FunctionSpace
+
+            self._coordinate_space = FunctionSpace(
+                self, LagrangeElement.get(self.cell, 1)
+            )
+
+        return self._coordinate_space
+
+    @property
+    def vertex_coords(self):
+        """The coordinates of all the vertices in the mesh. This array is
+        read only: to move the mesh, assign a new array, which invalidates
+        the cached cell geometry and discards any :attr:`structure`."""
+        return self._vertex_coords
+
+    @vertex_coords.setter
+    def vertex_coords(self, coords):
+        self._vertex_coords = np.array(coords, dtype=np.double)
+        self._vertex_coords.setflags(write=False)
+        self._geometry = {}
+        self.structure = None
+
+    def _cell_geometry(self):
+        """Compute the Jacobian, its determinant and its inverse transpose
+        on every cell at once, and cache the results until the vertex
+        coordinates change."""
+
+        if not self._geometry:
+            # On a structured mesh only one period of cells need be computed.
+            period = (self.structure or {}).get("period")
+            vertices = self.vertex_coords[self.cell_vertices[:period]]
+
+            # Column i of the Jacobian is the image of the i-th reference
+            # axis. This relies on the reference vertices other than the
+            # first lying at unit distance along successive axes.
+            J = np.ascontiguousarray(
+                (vertices[:, 1:, :] - vertices[:, :1, :]).transpose((0, 2, 1))
+            )
+
+            self._geometry = {
+                "J": J,
+                "detJ": np.linalg.det(J),
+                "invJT": np.ascontiguousarray(
+                    np.linalg.inv(J).transpose((0, 2, 1))
+                ),
+            }
+            if period:
+                copies = self.cell_vertices.shape[0] // period
+                for k, a in self._geometry.items():
+                    reps = (copies,) + (1,) * (a.ndim - 1)
+                    self._geometry[k] = np.tile(a, reps)
+            for a in self._geometry.values():
+                a.setflags(write=False)
+
+        return self._geometry
+
+    def _quadrature_geometry(self, rule):
+        """Map the points of a :class:`~.quadrature.QuadratureRule` into
+        every cell and scale its weights, caching the results alongside the
+        cell geometry."""
+
+        key = ("quadrature", rule)
+        if key not in self._geometry:
+            J = self.jacobians
+            origins = self.vertex_coords[self.cell_vertices[:, 0]]
+            points = origins[:, np.newaxis, :] + np.einsum(
+                "cij,qj->cqi", J, rule.points
+            )
+            weights = np.outer(
+                np.abs(self.jacobian_determinants), rule.weights
+            )
+            points.setflags(write=False)
+            weights.setflags(write=False)
+            self._geometry[key] = (points, weights)
+
+        return self._geometry[key]
+
+    def quadrature_points(self, rule):
+        """The physical points of a quadrature rule on every cell.
+
+        :param rule: A :class:`~.quadrature.QuadratureRule` on the
+            reference cell of this mesh.
+        :result: A read only (cells, points, dim) array. It is cached per
+            rule until the vertex coordinates change.
+        """
+        return self._quadrature_geometry(rule)[0]
+
+    def quadrature_weights(self, rule):
+        """The weights of a quadrature rule on every cell, multiplied by the
+        absolute value of the Jacobian determinant so that they integrate
+        over the physical cell.
+
+        :param rule: A :class:`~.quadrature.QuadratureRule` on the
+            reference cell of this mesh.
+        :result: A read only (cells, points) array. It is cached per rule
+            until the vertex coordinates change.
+        """
+        return self._quadrature_geometry(rule)[1]
+
+    @property
+    def jacobians(self):
+        """The Jacobian of every cell, as a (cells, dim, dim) array."""
+        return self._cell_geometry()["J"]
+
+    @property
+    def jacobian_determinants(self):
+        """The determinant of the Jacobian of every cell."""
+        return self._cell_geometry()["detJ"]
+
+    @property
+    def inverse_jacobian_transposes(self):
+        """The inverse transpose of the Jacobian of every cell, as a
+        (cells, dim, dim) array. This maps reference gradients to physical
+        gradients."""
+        return self._cell_geometry()["invJT"]
+
+    def _exterior_facet_topology(self):
+        """Find the facets which are incident to only one cell, and the
+        cell and local facet index of each."""
+
+        if self._exterior_facets is None:
+            cell_facets = self.adjacency(self.dim, self.dim - 1)
+            counts = np.bincount(
+                cell_facets.ravel(), minlength=self.entity_counts[-2]
+            )
+            cells, local = np.nonzero(counts[cell_facets] == 1)
+            self._exterior_facets = (
+                cell_facets[cells, local].astype(np.int32),
+                cells.astype(np.int32),
+                local.astype(np.int32),
+            )
+            for a in self._exterior_facets:
+                a.setflags(write=False)
+
+        return self._exterior_facets
+
+    @property
+    def exterior_facets(self):
+        """The indices of the facets on the boundary of the mesh: the edges
+        of a 2D mesh or the vertices of a 1D mesh."""
+        return self._exterior_facet_topology()[0]
+
+    @property
+    def exterior_facet_cells(self):
+        """The cell incident to each of the :attr:`exterior_facets`."""
+        return self._exterior_facet_topology()[1]
+
+    @property
+    def exterior_facet_local_facets(self):
+        """The local index in its cell of each of the
+        :attr:`exterior_facets`. This is the index of the facet in the
+        topology of the reference cell."""
+        return self._exterior_facet_topology()[2]
+
+    @property
+    def exterior_facet_normals(self):
+        """The outward unit normal to each of the :attr:`exterior_facets`,
+        as an (exterior facets, dim) array."""
+
+        if "normals" not in self._geometry:
+            # The outward normals of the facets of the reference cell.
+            # Normals transform like gradients, which keeps them outward.
+            reference = {
+                1: np.array([[-1.0], [1.0]]),
+                2: np.array([[1.0, 1.0], [-1.0, 0.0], [0.0, -1.0]]),
+            }[self.dim]
+            normals = np.einsum(
+                "cij,cj->ci",
+                self.inverse_jacobian_transposes[self.exterior_facet_cells],
+                reference[self.exterior_facet_local_facets],
+            )
+            normals /= np.linalg.norm(normals, axis=1)[:, np.newaxis]
+            normals.setflags(write=False)
+            self._geometry["normals"] = normals
+
+        return self._geometry["normals"]
+
     def adjacency(self, dim1, dim2):
         """Return the set of `dim2` entities adjacent to each `dim1`
         entity. For example if `dim1==2` and `dim2==1` then return the list of
@@ -120,14 +308,115 @@ class Mesh(object):
             else:
                 return self.cell_edges
 
+    def csr_adjacency(self, dim1, dim2):
+        """Return the `dim2` entities adjacent to each `dim1` entity in
+        compressed sparse row form. Unlike :meth:`adjacency`, this supports
+        upward adjacency, for example from vertices to the cells around
+        them, in which the number of adjacent entities varies.
+
+        :result: A tuple ``(offsets, indices)`` of int32 arrays such that
+            the entities adjacent to entity ``(dim1, e1)`` are
+            ``indices[offsets[e1]:offsets[e1 + 1]]``. These are in
+            ascending order, except that downward adjacencies keep the
+            local ordering of :meth:`adjacency`.
+
+        If ``dim1 == dim2``, two distinct entities are adjacent if they
+        share an entity of one dimension lower: cells are adjacent across
+        facets and edges at vertices. Vertices are adjacent if they share
+        an edge.
+
+        The arrays are built by sorting, and are cached and read only.
+        """
+
+        for d in (dim1, dim2):
+            if not 0 <= d <= self.dim:
+                raise ValueError("Entity dimensions must lie in [0, dim].")
+
+        key = (dim1, dim2)
+        if key not in self._csr_adjacency:
+            if dim1 > dim2:
+                down = self.adjacency(dim1, dim2)
+                offsets = np.arange(
+                    0, down.size + 1, down.shape[1], dtype=np.int32
+                )
+                csr = (offsets, down.ravel().astype(np.int32))
+            elif dim1 < dim2:
+                csr = self._upward_adjacency(dim1, dim2)
+            elif dim1 > 0:
+                csr = self._shared_adjacency(
+                    dim1, *self.csr_adjacency(dim1 - 1, dim1)
+                )
+            else:
+                csr = self._shared_adjacency(0, *self.csr_adjacency(1, 0))
+            for a in csr:
+                a.setflags(write=False)
+            self._csr_adjacency[key] = csr
+
+        return self._csr_adjacency[key]
+
+    def _upward_adjacency(self, dim1, dim2):
+        # Invert the downward adjacency by sorting its entries by the
+        # lower dimensional entity. The stable sort keeps the higher
+        # dimensional entities in ascending order.
+        down = self.adjacency(dim2, dim1)
+        flat = down.ravel()
+        order = np.argsort(flat, kind="stable")
+        counts = np.bincount(flat, minlength=self.entity_counts[dim1])
+        offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int32)
+        return offsets, (order // down.shape[1]).astype(np.int32)
+
+    def _shared_adjacency(self, dim, offsets, indices):
+        # Given, for each connecting entity, the dim entities incident to
+        # it as a CSR pair, pair up every two dim entities which share a
+        # connecting entity.
+        counts = np.diff(offsets)
+        connector = np.repeat(np.arange(len(counts)), counts)
+        repeats = counts[connector]
+        first = np.repeat(indices, repeats)
+        position = np.arange(repeats.sum()) - np.repeat(
+            np.cumsum(repeats) - repeats, repeats
+        )
+        second = indices[np.repeat(offsets[connector], repeats) + position]
+
+        n = self.entity_counts[dim]
+        distinct = first != second
+        pairs = np.sort(
+            first[distinct].astype(np.int64) * n + second[distinct]
+        )
+        # Entities sharing several connecting entities are paired more
+        # than once.
+        pairs = pairs[np.concatenate(([True], pairs[1:] != pairs[:-1]))]
+        new_offsets = np.concatenate(
+            ([0], np.cumsum(np.bincount(pairs // n, minlength=n)))
+        )
+        return new_offsets.astype(np.int32), (pairs % n).astype(np.int32)
+
+    @property
+    def edge_cells(self):
+        """The cells incident to each edge of a 2D mesh, as an (edges, 2)
+        array. Edges on the boundary have only one cell, and their second
+        entry is -1."""
+
+        if "edge_cells" not in self._csr_adjacency:
+            offsets, indices = self.csr_adjacency(1, 2)
+            edge_cells = np.full((len(offsets) - 1, 2), -1, dtype=np.int32)
+            edge_cells[:, 0] = indices[offsets[:-1]]
+            interior = np.diff(offsets) == 2
+            edge_cells[interior, 1] = indices[offsets[:-1][interior] + 1]
+            edge_cells.setflags(write=False)
+            self._csr_adjacency["edge_cells"] = edge_cells
+
+        return self._csr_adjacency["edge_cells"]
+
     def jacobian(self, c):
         """Return the Jacobian matrix for the specified cell.
 
         :param c: The number of the cell for which to return the Jacobian.
-        :result: The Jacobian for cell ``c``.
+        :result: The Jacobian for cell ``c``. This is a read only view of
+            :attr:`jacobians`.
         """
 
-        raise NotImplementedError
+        return self.jacobians[c]
 
 
 class UnitIntervalMesh(Mesh):
@@ -137,28 +426,70 @@ class UnitIntervalMesh(Mesh):
         """
         :param nx: The number of cells.
         """
-        points = np.array(list((x,) for x in np.linspace(0, 1, nx + 1)))
-        points.shape = (points.shape[0], 1)
+        points = np.linspace(0, 1, nx + 1).reshape((nx + 1, 1))
 
-        cells = np.array(list((a, a + 1) for a in range(nx)))
+        cells = np.stack((np.arange(nx), np.arange(1, nx + 1)), axis=1)
 
-        super(UnitIntervalMesh, self).__init__(points, cells)
+        super(UnitIntervalMesh, self).__init__(
+            points,
+            cells,
+            structure={"shape": (nx,), "spacing": (1.0 / nx,), "period": 1},
+        )
 
 
 class UnitSquareMesh(Mesh):
     """A triangulated :class:`Mesh` of the unit square."""
 
-    def __init__(self, nx, ny):
+    def __init__(self, nx, ny, diagonal="left"):
         """
         :param nx: The number of cells in the x direction.
         :param ny: The number of cells in the y direction.
+        :param diagonal: The diagonal along which each square is split:
+          ``"left"`` for the diagonal from top left to bottom right,
+          ``"right"`` for the diagonal from bottom left to top right, or
+          ``"crossed"`` to split each square into four triangles about a
+          new vertex at its centre.
+
+        The vertices of the grid are numbered with the y index varying
+        fastest, and the triangles within each square are numbered
+        consecutively.
         """
-        points = list(
-            (x, y)
-            for x in np.linspace(0, 1, nx + 1)
-            for y in np.linspace(0, 1, ny + 1)
+        x, y = np.meshgrid(
+            np.linspace(0, 1, nx + 1), np.linspace(0, 1, ny + 1), indexing="ij"
+        )
+        points = np.stack((x.ravel(), y.ravel()), axis=1)
+
+        # The corners of each square, anticlockwise from the bottom left.
+        v = np.arange(points.shape[0]).reshape((nx + 1, ny + 1))
+        a = v[:-1, :-1].ravel()
+        b = v[1:, :-1].ravel()
+        c = v[1:, 1:].ravel()
+        d = v[:-1, 1:].ravel()
+
+        if diagonal == "left":
+            triangles = [(a, b, d), (b, c, d)]
+        elif diagonal == "right":
+            triangles = [(a, b, c), (a, c, d)]
+        elif diagonal == "crossed":
+            m = np.arange(points.shape[0], points.shape[0] + nx * ny)
+            points = np.concatenate(
+                (points, (points[a] + points[c]) / 2.0), axis=0
+            )
+            triangles = [(a, b, m), (b, c, m), (c, d, m), (d, a, m)]
+        else:
+            raise ValueError("Unknown diagonal: %s" % diagonal)
+
+        cells = np.stack(
+            [np.stack(t, axis=1) for t in triangles], axis=1
+        ).reshape((-1, 3))
+
+        super(UnitSquareMesh, self).__init__(
+            points,
+            cells,
+            structure={
+                "shape": (nx, ny),
+                "spacing": (1.0 / nx, 1.0 / ny),
+                "diagonal": diagonal,
+                "period": len(triangles),
+            },
         )
-
-        mesh = Delaunay(points)
-
-        super(UnitSquareMesh, self).__init__(mesh.points, mesh.simplices)
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from numpy.polynomial.legendre import leggauss
 from .reference_elements import ReferenceInterval, ReferenceTriangle
 import numpy as np
@@ -20,9 +21,10 @@ class QuadratureRule(object):
         #: rule is defined.
         self.cell = cell
         #: Two dimensional array, the rows of which form the position
-        #: vectors of the quadrature points.
+        #: vectors of the quadrature points. This array is read only.
         self.points = np.array(points, dtype=np.double)
-        #: The corresponding array of quadrature weights.
+        #: The corresponding array of quadrature weights. This array is
+        #: read only.
         self.weights = np.array(weights, dtype=np.double)
         #: The degree of precision of the quadrature rule.
         self.degree = degree
@@ -37,28 +39,234 @@ class QuadratureRule(object):
                 "Number of quadrature points and quadrature weights must match"
             )
 
+        # Rules are shared between all callers of gauss_quadrature.
+        self.points.setflags(write=False)
+        self.weights.setflags(write=False)
+
     def integrate(self, function):
         """Integrate the function provided using this quadrature rule.
 
         :param function: A Python function taking a position vector as
           its single argument and returning a scalar value.
 
-        The implementation of this method is left as an :ref:`exercise
-        <ex-integrate>`.
+        ``function`` may also return an array, in which case each entry is
+        integrated. Vectorised functions are called once for all of the
+        points (see :func:`~.utils.evaluate_at_points`), so many
+        integrands are integrated in a single weighted contraction.
         """
 
-        raise NotImplementedError
+        from .utils import evaluate_at_points
+
+        values = evaluate_at_points(function, self.points)
+        result = np.tensordot(self.weights, values, axes=1)
+
+        return float(result) if result.ndim == 0 else result
+
+    def integrate_affine(self, function, jacobians, origins=None):
+        """Integrate the function provided over a batch of affine images of
+        the reference cell.
+
+        :param function: A Python function of the physical coordinates, as
+          for :meth:`integrate`.
+        :param jacobians: A (cells, dim, dim) array of the Jacobians of the
+          affine maps.
+        :param origins: A (cells, dim) array of the images of the origin
+          of the reference cell. Defaults to zero.
+        :result: An array of the integral over each cell, of shape (cells,)
+          followed by the shape of the value of ``function``.
+
+        ``function`` is evaluated at the quadrature points of all of the
+        cells at once. For the cells of a :class:`~.mesh.Mesh`, pass
+        :attr:`~.mesh.Mesh.jacobians` and the coordinates of the first
+        vertex of each cell.
+        """
+
+        from .utils import evaluate_at_points
+
+        jacobians = np.asarray(jacobians, dtype=np.double)
+        points = np.einsum("cij,qj->cqi", jacobians, self.points)
+        if origins is not None:
+            points += np.asarray(origins)[:, np.newaxis, :]
+
+        values = evaluate_at_points(
+            function, points.reshape(-1, self.cell.dim)
+        )
+        values = values.reshape(points.shape[:2] + values.shape[1:])
+
+        weights = np.outer(np.abs(np.linalg.det(jacobians)), self.weights)
+        return np.einsum("cq,cq...->c...", weights, values)
+
 
+#: Fully symmetric quadrature rules on the reference triangle with
+#: positive weights and interior points, in the style of Dunavant and of
+#: Xiao and Gimbutas. They were found by solving the moment equations for
+#: the orthonormal basis by nonlinear least squares. Each entry maps the
+#: degree of precision to the weight of the centroid, if it is a point,
+#: the ``(weight, a)`` of each orbit of the three points with barycentric
+#: coordinates ``(a, a, 1 - 2a)``, and the ``(weight, a, b)`` of each
+#: orbit of the six points with barycentric coordinates ``(a, b, 1 - a -
+#: b)``.
+_symmetric_triangle_rules = {
+    1: (
+        (0.5,),
+        (),
+        (),
+    ),
+    2: (
+        (),
+        (
+            (0.16666666666666666, 0.16666666666666666),
+        ),
+        (),
+    ),
+    4: (
+        (),
+        (
+            (0.11169079483900578, 0.44594849091596483),
+            (0.054975871827660915, 0.09157621350977076),
+        ),
+        (),
+    ),
+    5: (
+        (0.1125,),
+        (
+            (0.06296959027241357, 0.10128650732345636),
+            (0.0661970763942531, 0.47014206410511505),
+        ),
+        (),
+    ),
+    6: (
+        (),
+        (
+            (0.058393137863189656, 0.24928674517091043),
+            (0.025422453185103434, 0.06308901449150225),
+        ),
+        (
+            (0.041425537809186785, 0.6365024991213987, 0.053145049844816966),
+        ),
+    ),
+    7: (
+        (),
+        (
+            (0.0648752390264396, 0.24039989320629288),
+            (0.005007572587714966, 0.01985983352354554),
+            (0.04052645695233764, 0.4743206665595563),
+        ),
+        (
+            (0.028128699050087247, 0.04501714251902221, 0.18515687275650983),
+        ),
+    ),
+    8: (
+        (0.07215780383889359,),
+        (
+            (0.0475458171336423, 0.4592925882927231),
+            (0.05160868526735915, 0.1705693077517602),
+            (0.016229248811599047, 0.05054722831703105),
+        ),
+        (
+            (0.013615157087217502, 0.2631128296346381, 0.7284923929554042),
+        ),
+    ),
+    9: (
+        (0.048567898141399446,),
+        (
+            (0.01566735011356949, 0.4896825191987377),
+            (0.039823869463605145, 0.18820353561903275),
+            (0.01278883782934902, 0.04472951339445271),
+            (0.03891377050238715, 0.4370895914929367),
+        ),
+        (
+            (0.021641769688644685, 0.22196298916076568, 0.0368384120547363),
+        ),
+    ),
+    10: (
+        (0.041609868493225025,),
+        (
+            (0.005475644170134198, 0.028503500288387787),
+            (0.02632597473412233, 0.1629131178740948),
+        ),
+        (
+            (0.014661432047826117, 0.8130112461498284, 0.15330305516956128),
+            (0.028138639855405552, 0.1468115053939304, 0.5164926193278379),
+            (0.0176974738957692, 0.029307604504579463, 0.60732977850085),
+        ),
+    ),
+    12: (
+        (),
+        (
+            (0.014243026034438748, 0.10925782765935417),
+            (0.01213341904072605, 0.4882037509455416),
+            (0.024959167464030457, 0.44011164865859315),
+            (0.03127060659795134, 0.2714625070149261),
+            (0.003965821254986861, 0.024646363436335594),
+        ),
+        (
+            (0.02161368182970708, 0.11629601967792656, 0.6282497516835562),
+            (0.010891792519303804, 0.29165567973834106, 0.023034156355267107),
+            (0.007541838788255741, 0.021382490256170526, 0.85133779251024),
+        ),
+    ),
+}
 
-def gauss_quadrature(cell, degree):
+
+def _symmetric_triangle_rule(degree):
+    """Return the points and weights of the smallest tabulated symmetric
+    triangle rule of at least the degree given."""
+
+    centroid, orbits3, orbits6 = _symmetric_triangle_rules[
+        min(d for d in _symmetric_triangle_rules if d >= degree)
+    ]
+
+    points = [(1 / 3, 1 / 3)] * len(centroid)
+    weights = list(centroid)
+    for w, a in orbits3:
+        b = 1 - 2 * a
+        points += [(a, a), (a, b), (b, a)]
+        weights += [w] * 3
+    for w, a, b in orbits6:
+        c = 1 - a - b
+        points += [(a, b), (b, a), (a, c), (c, a), (b, c), (c, b)]
+        weights += [w] * 6
+
+    return points, weights
+
+
+def gauss_quadrature(cell, degree, family="gauss"):
     """Return a Gauss-Legendre :class:`QuadratureRule`.
 
     :param cell: the :class:`~.ReferenceCell` over which this quadrature
       rule is defined.
     :param degree: the :ref:`degree of precision <degree-of-precision>`
       of this quadrature rule.
+    :param family: ``"gauss"`` for the collapsed Gauss-Legendre rules, or
+      ``"symmetric"`` for fully symmetric rules on the triangle. These
+      use far fewer points, for example 25 rather than 36 at degree 10.
+      Above the highest tabulated degree, and on the interval, where the
+      Gauss-Legendre rule is already symmetric, the Gauss-Legendre rule
+      is returned.
+
+    Rules are cached, so repeated calls with the same arguments return
+    the same read only :class:`QuadratureRule`. The cache hit and miss
+    counts are reported by ``gauss_quadrature.cache_info()``.
     """
 
+    # The cache is keyed on the normalised arguments, so that every way of
+    # requesting a rule returns the same object.
+    return _gauss_quadrature(cell, int(degree), family)
+
+
+@lru_cache(maxsize=128)
+def _gauss_quadrature(cell, degree, family, /):
+    if family == "symmetric":
+        if cell is not ReferenceTriangle or degree > max(
+            _symmetric_triangle_rules
+        ):
+            return _gauss_quadrature(cell, degree, "gauss")
+        points, weights = _symmetric_triangle_rule(degree)
+        return QuadratureRule(cell, degree, points, weights)
+    elif family != "gauss":
+        raise ValueError("Unknown quadrature family: %s" % family)
+
     if cell is ReferenceInterval:
         # We can obtain the 1D gauss-legendre rule from numpy
         # and change coordinates.
@@ -80,22 +288,104 @@ def gauss_quadrature(cell, degree):
     elif cell is ReferenceTriangle:
         # The 2D rule is obtained using the 1D rule and the Duffy Transform.
 
-        p1 = gauss_quadrature(ReferenceInterval, degree + 1)
-        q1 = gauss_quadrature(ReferenceInterval, degree)
+        p1 = _gauss_quadrature(ReferenceInterval, degree + 1, "gauss")
+        q1 = _gauss_quadrature(ReferenceInterval, degree, "gauss")
 
-        points = np.array(
-            [(p[0], q[0] * (1 - p[0])) for p in p1.points for q in q1.points]
-        )
+        x = p1.points[:, 0]
+        y = q1.points[:, 0]
 
-        weights = np.array(
-            [
-                p * q * (1 - x[0])
-                for p, x in zip(p1.weights, p1.points)
-                for q in q1.weights
-            ]
+        points = np.stack(
+            (np.repeat(x, len(y)), np.outer(1 - x, y).ravel()), axis=1
         )
 
+        weights = np.outer(p1.weights * (1 - x), q1.weights).ravel()
+
     else:
         raise ValueError("Unknown reference cell")
 
     return QuadratureRule(cell, degree, points, weights)
+
+
+gauss_quadrature.cache_info = _gauss_quadrature.cache_info
+
+
+@lru_cache(maxsize=128)
+def facet_quadrature(cell, facet, degree):
+    """Return a :class:`QuadratureRule` on a facet of a reference cell.
+
+    :param cell: the :class:`~.ReferenceCell` whose facet is integrated
+      over.
+    :param facet: the local index of the facet, which is the entity
+      ``(cell.dim - 1, facet)`` of the cell.
+    :param degree: the :ref:`degree of precision <degree-of-precision>`
+      of this quadrature rule.
+
+    The points are given in the coordinates of the cell, so the basis
+    functions of an element on the cell can be tabulated at them
+    directly, and each element caches the tabulation for each facet. The
+    weights sum to one, so they integrate over a facet of unit measure.
+    The facets of the interval are its vertices, on which the rule is the
+    vertex with weight one.
+    """
+
+    vertices = cell.vertices[cell.topology[cell.dim - 1][facet]]
+
+    if cell.dim == 1:
+        points, weights = vertices, [1.0]
+    else:
+        Q = gauss_quadrature(ReferenceInterval, degree)
+        points = vertices[0] + Q.points * (vertices[1] - vertices[0])
+        weights = Q.weights
+
+    return QuadratureRule(cell, degree, points, weights)
+
+
+def adaptive_integrate(
+    mesh, function, tolerance=1e-8, degree=2, max_degree=24
+):
+    """Integrate a function over each cell of a mesh, raising the degree of
+    the quadrature only on the cells where it is needed.
+
+    :param mesh: the :class:`~.mesh.Mesh` over which to integrate.
+    :param function: a Python function of the physical coordinates
+      returning a scalar value. It is evaluated at the quadrature points
+      of many cells at once, as in
+      :meth:`QuadratureRule.integrate_affine`.
+    :param tolerance: the target for the total error. Each cell is allowed
+      a share of it proportional to its measure.
+    :param degree: the degree of the first rule used on every cell.
+    :param max_degree: the highest degree of rule to use.
+    :result: a tuple of the array of integrals over each cell, the array
+      of their estimated errors, and the total number of points at which
+      ``function`` was evaluated.
+
+    The degree is raised in steps of two. The error of the integral on a
+    cell is estimated as its difference from the integral with the next
+    rule, and the more accurate value is kept, so the estimate is
+    pessimistic. Only the cells whose estimate exceeds their share of the
+    tolerance are integrated again. The symmetric rules are used on
+    triangles as they need the fewest points.
+    """
+
+    J = mesh.jacobians
+    origins = mesh.vertex_coords[mesh.cell_vertices[:, 0]]
+    share = np.abs(mesh.jacobian_determinants)
+    share = tolerance * share / share.sum()
+
+    Q = gauss_quadrature(mesh.cell, degree, "symmetric")
+    integrals = Q.integrate_affine(function, J, origins)
+    errors = np.full(len(integrals), np.inf)
+    evaluations = len(integrals) * len(Q.weights)
+
+    active = np.arange(len(integrals))
+    while len(active) and degree + 2 <= max_degree:
+        degree += 2
+        Q = gauss_quadrature(mesh.cell, degree, "symmetric")
+        refined = Q.integrate_affine(function, J[active], origins[active])
+        evaluations += len(active) * len(Q.weights)
+
+        errors[active] = np.abs(refined - integrals[active])
+        integrals[active] = refined
+        active = active[errors[active] > share[active]]
+
+    return integrals, errors, evaluations
@@ -3,7 +3,6 @@ from matplotlib import pyplot as plt
 from fe_utils import ReferenceTriangle, ReferenceInterval, \
     LagrangeElement, UnitSquareMesh, UnitIntervalMesh, FunctionSpace
 from argparse import ArgumentParser
-import numpy as np
 
 
 def plot_function_space_nodes():
@@ -34,17 +33,7 @@ of the specified degree on a regular mesh."""
         mesh = UnitIntervalMesh(resolution)
     fs = FunctionSpace(mesh, fe)
 
-    nodes = np.empty((fs.node_count, cell.dim))
-    cg1 = LagrangeElement(cell, 1)
-    cg1fs = FunctionSpace(mesh, cg1)
-    coord_map = cg1.tabulate(fe.nodes)
-    for c in range(mesh.entity_counts[-1]):
-        # Interpolate the coordinates to the cell nodes.
-        vertex_coords = mesh.vertex_coords[cg1fs.cell_nodes[c, :], :]
-        lcoords = np.dot(coord_map, vertex_coords)
-
-        # Insert the resulting cells into the global set.
-        nodes[fs.cell_nodes[c, :].astype(int), :] = lcoords
+    nodes = fs.node_coordinates
 
     fig = plt.figure()
     ax = fig.add_subplot(111)
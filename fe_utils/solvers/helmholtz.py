@@ -4,7 +4,6 @@ imported as a module and convergence tests run on the solver.
 """
 
 from fe_utils import *
-import numpy as np
 from numpy import cos, pi
 import scipy.sparse as sp
 import scipy.sparse.linalg as splinalg
@@ -16,19 +15,9 @@ def assemble(fs, f):
     the function space in which to solve and the right hand side
     function."""
 
-    raise NotImplementedError
-
-    # Create an appropriate (complete) quadrature rule.
-
-    # Tabulate the basis functions and their gradients at the quadrature points.
-
-    # Create the left hand side matrix and right hand side vector.
-    # This creates a sparse matrix because creating a dense one may
-    # well run your machine out of memory!
-    A = sp.lil_matrix((fs.node_count, fs.node_count))
-    l = np.zeros(fs.node_count)
-
-    # Now loop over all the cells and assemble A and l
+    # The Helmholtz operator is the sum of the stiffness and mass terms.
+    A = assemble_matrix(fs, mass=1.0, stiffness=1.0)
+    l = assemble_vector(fs, f)
 
     return A, l
 
@@ -40,7 +29,7 @@ def solve_helmholtz(degree, resolution, analytic=False, return_error=False):
 
     # Set up the mesh, finite element and function space required.
     mesh = UnitSquareMesh(resolution, resolution)
-    fe = LagrangeElement(mesh.cell, degree)
+    fe = LagrangeElement.get(mesh.cell, degree)
     fs = FunctionSpace(mesh, fe)
 
     # Create a function to hold the analytic solution for comparison purposes.
@@ -2,44 +2,147 @@ import numpy as np
 from .quadrature import gauss_quadrature
 
 
-def errornorm(f1, f2):
-    """Calculate the L^2 norm of the difference between f1 and f2."""
-
-    fs1 = f1.function_space
-    fs2 = f2.function_space
-
-    fe1 = fs1.element
-    fe2 = fs2.element
-    mesh = fs1.mesh
-
-    # Create a quadrature rule which is exact for (f1-f2)**2.
-    Q = gauss_quadrature(fe1.cell, 2 * max(fe1.degree, fe2.degree))
-
-    # Evaluate the local basis functions at the quadrature points.
-    phi = fe1.tabulate(Q.points)
-    psi = fe2.tabulate(Q.points)
-
-    norm = 0.0
-    for c in range(mesh.entity_counts[-1]):
-        # Find the appropriate global node numbers for this cell.
-        nodes1 = fs1.cell_nodes[c, :]
-        nodes2 = fs2.cell_nodes[c, :]
-
-        # Compute the change of coordinates.
-        J = mesh.jacobian(c)
-        detJ = np.abs(np.linalg.det(J))
-
-        # Compute the actual cell quadrature.
-        norm += (
-            np.dot(
-                (
-                    np.dot(f1.values[nodes1], phi.T)
-                    - np.dot(f2.values[nodes2], psi.T)
-                )
-                ** 2,
-                Q.weights,
+def evaluate_at_points(fn, points):
+    """Evaluate a Python function at each of the points provided.
+
+    :param fn: A function ``fn(X)`` which takes a coordinate vector and
+      returns a scalar or array value.
+    :param points: A (points, dim) array of coordinates.
+    :result: An array of shape (points,) + the shape of the value of ``fn``.
+
+    Calling ``fn`` once per point is slow, so ``fn`` is first called once
+    on all of the points: with the coordinate columns, so that ``X[0]`` is
+    the array of first coordinates, and failing that with the whole
+    (points, dim) array. A result is only accepted if it has the right
+    shape and agrees with ``fn`` evaluated at the first and last points.
+    Array valued functions called with the coordinate columns may put the
+    points axis last, as ``lambda X: np.array([X[1], -X[0]])`` does.
+    Otherwise ``fn`` is evaluated point by point.
+
+    If ``fn`` cannot be evaluated at a single point, a result is accepted
+    on its shape alone. When there are as many points as dimensions, the
+    two layouts have the same shape, so only the (points, dim) array is
+    tried.
+    """
+
+    points = np.asarray(points, dtype=np.double)
+
+    if len(points) == 0:
+        return np.array([fn(x) for x in points])
+
+    try:
+        first = np.asarray(fn(points[0]))
+        last = np.asarray(fn(points[-1]))
+    except Exception:
+        # fn only accepts arrays of points.
+        first = None
+
+    layouts = (points.T, points)
+    if first is None and points.shape[0] == points.shape[1]:
+        layouts = (points,)
+
+    for X in layouts:
+        try:
+            values = np.asarray(fn(X))
+        except Exception:
+            continue
+        if first is None:
+            if values.shape[:1] == (len(points),):
+                return values
+            continue
+        if X is not points and first.ndim and values.shape[-1:] == (
+            len(points),
+        ):
+            values = np.moveaxis(values, -1, 0)
+        if (
+            values.shape == (len(points),) + first.shape
+            and np.allclose(values[0], first, equal_nan=True)
+            and np.allclose(values[-1], last, equal_nan=True)
+        ):
+            return values
+
+    return np.array([fn(x) for x in points])
+
+
+def errornorm(f1, f2, norm_type="L2", quadrature_degree=None, gradient=None):
+    """Calculate the norm of the difference between f1 and f2.
+
+    :param f1: A :class:`~.function_spaces.Function`, or a Python
+        function of the physical coordinates such as the analytic
+        solution.
+    :param f2: A :class:`~.function_spaces.Function`, or a Python
+        function. At least one of ``f1`` and ``f2`` must be a
+        :class:`~.function_spaces.Function`, whose mesh is used.
+    :param norm_type: ``"L2"``, the :math:`H^1` seminorm ``"H10"`` or the
+        full :math:`H^1` norm ``"H1"``.
+    :param quadrature_degree: The degree of the quadrature rule used. By
+        default this is exact for the difference of two
+        :class:`~.function_spaces.Function` objects, and two degrees
+        higher for each when a Python function is involved.
+    :param gradient: A Python function returning the gradient of
+        whichever of ``f1`` and ``f2`` is a Python function. Required for
+        the :math:`H^1` norms in that case.
+
+    Python functions are evaluated directly at the physical quadrature
+    points of all the cells at once, using
+    :func:`evaluate_at_points`, so no interpolation error is incurred.
+    """
+
+    if norm_type not in ("L2", "H1", "H10"):
+        raise ValueError("Unknown norm type: %s" % norm_type)
+    grad = norm_type != "L2"
+
+    functions = [f for f in (f1, f2) if hasattr(f, "function_space")]
+    if not functions:
+        raise ValueError("At least one argument must be a Function")
+    if grad and len(functions) < 2 and gradient is None:
+        raise ValueError("The %s norm needs the gradient" % norm_type)
+
+    mesh = functions[0].function_space.mesh
+
+    if quadrature_degree is None:
+        degree = max(f.function_space.element.degree for f in functions)
+        if len(functions) < 2:
+            degree += 2
+        quadrature_degree = 2 * degree
+    Q = gauss_quadrature(mesh.cell, quadrature_degree, "symmetric")
+
+    # The physical quadrature points of every cell.
+    x = mesh.quadrature_points(Q)
+
+    def evaluate(f, fn_gradient):
+        # The values and gradients of f at the quadrature points.
+        if hasattr(f, "function_space"):
+            fs = f.function_space
+            values = f.values[fs.cell_nodes]
+            u = np.dot(values, fs.element.tabulate(Q.points).T)
+            if not grad:
+                return u, None
+            du = np.einsum(
+                "cn,qnd,ckd->cqk",
+                values,
+                fs.element.tabulate(Q.points, grad=True),
+                mesh.inverse_jacobian_transposes,
+                optimize=True,
             )
-            * detJ
-        )
+            return u, du
+        else:
+            points = x.reshape(-1, mesh.dim)
+            u = evaluate_at_points(f, points).reshape(x.shape[:2])
+            if not grad:
+                return u, None
+            du = evaluate_at_points(fn_gradient, points).reshape(x.shape)
+            return u, du
+
+    u1, du1 = evaluate(f1, gradient)
+    u2, du2 = evaluate(f2, gradient)
+
+    integrand = np.zeros(x.shape[:2])
+    if norm_type != "H10":
+        integrand += (u1 - u2) ** 2
+    if grad:
+        integrand += np.sum((du1 - du2) ** 2, axis=-1)
+
+    norm = np.sum(integrand * mesh.quadrature_weights(Q))
 
     return norm**0.5
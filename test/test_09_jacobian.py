@@ -1,7 +1,7 @@
 '''Test jacobian formation.'''
 import pytest
 from fe_utils import UnitIntervalMesh, UnitSquareMesh, LagrangeElement, \
-    FunctionSpace, Function
+    FunctionSpace, Function, gauss_quadrature
 import numpy as np
 
 
@@ -85,6 +85,56 @@ def test_gradient_2d():
                     "Jacobian produces incorrect gradients."
 
 
+@pytest.mark.parametrize('m', (UnitIntervalMesh(3), UnitSquareMesh(3, 2)))
+def test_batched_geometry(m):
+    """The batched geometry agrees with the per-cell Jacobians."""
+
+    J = m.jacobians
+
+    assert J.shape == (m.entity_counts[-1], m.dim, m.dim)
+    for c in range(m.entity_counts[-1]):
+        assert np.shares_memory(m.jacobian(c), J)
+        assert np.isclose(m.jacobian_determinants[c],
+                          np.linalg.det(m.jacobian(c)))
+        assert np.allclose(m.inverse_jacobian_transposes[c],
+                           np.linalg.inv(m.jacobian(c)).T)
+
+
+def test_geometry_invalidation():
+    """Assigning new coordinates invalidates the cached geometry."""
+
+    m = UnitSquareMesh(2, 2)
+    detJ = m.jacobian_determinants.copy()
+
+    m.vertex_coords = 2 * m.vertex_coords
+
+    assert np.allclose(m.jacobian_determinants, 4 * detJ)
+
+
+@pytest.mark.parametrize('m', (UnitIntervalMesh(3), UnitSquareMesh(3, 2)))
+def test_quadrature_geometry(m):
+    """The physical quadrature points are the images of the reference
+    points and the weights integrate over the physical cells."""
+
+    Q = gauss_quadrature(m.cell, 3)
+    x = m.quadrature_points(Q)
+    w = m.quadrature_weights(Q)
+
+    assert x.shape == (m.entity_counts[-1], len(Q.weights), m.dim)
+    assert w.shape == (m.entity_counts[-1], len(Q.weights))
+    assert np.isclose(w.sum(), 1.0)
+    cs = m.coordinate_space
+    assert np.allclose(x, np.einsum("qv,cvd->cqd",
+                                    cs.element.tabulate(Q.points),
+                                    m.vertex_coords[cs.cell_nodes]))
+    assert m.quadrature_points(Q) is x, "Quadrature points not cached"
+
+    m.vertex_coords = 2 * m.vertex_coords
+
+    assert np.allclose(m.quadrature_points(Q), 2 * x)
+    assert np.isclose(m.quadrature_weights(Q).sum(), 2**m.dim)
+
+
 if __name__ == '__main__':
     import sys
     pytest.main(sys.argv)
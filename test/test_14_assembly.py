@@ -0,0 +1,132 @@
+'''Test the vectorised assembly of global matrices and vectors.'''
+import pytest
+from fe_utils import UnitSquareMesh, UnitIntervalMesh, \
+    FunctionSpace, LagrangeElement, Function
+from fe_utils.assembly import assemble_matrix, assemble_vector, \
+    local_matrices
+from fe_utils import ReferenceInterval, ReferenceTriangle, \
+    gauss_quadrature
+import numpy as np
+import scipy.sparse as sp
+
+
+@pytest.mark.parametrize('degree, mesh',
+                         [(d, m)
+                          for d in range(1, 5)
+                          for m in (UnitIntervalMesh(3),
+                                    UnitSquareMesh(3, 2))])
+def test_mass_matrix_measure(degree, mesh):
+    """The entries of the mass matrix sum to the area of the domain."""
+
+    fs = FunctionSpace(mesh, LagrangeElement(mesh.cell, degree))
+
+    M = assemble_matrix(fs, mass=1.0, stiffness=0.0)
+
+    assert round(M.sum() - 1.0, 12) == 0
+
+
+@pytest.mark.parametrize('degree, mesh',
+                         [(d, m)
+                          for d in range(1, 5)
+                          for m in (UnitIntervalMesh(3),
+                                    UnitSquareMesh(3, 2))])
+def test_stiffness_matrix_energy(degree, mesh):
+    """The stiffness matrix applied to x gives the integral of |grad x|^2."""
+
+    fs = FunctionSpace(mesh, LagrangeElement(mesh.cell, degree))
+    f = Function(fs)
+    f.interpolate(lambda x: x[0])
+
+    A = assemble_matrix(fs, mass=0.0, stiffness=1.0)
+
+    assert np.allclose(A @ np.ones(fs.node_count), 0.0)
+    assert round(f.values @ A @ f.values - 1.0, 12) == 0
+
+
+@pytest.mark.parametrize('degree', range(1, 4))
+def test_assemble_vector(degree):
+    """Assembling a Function against the test functions matches the mass
+    matrix action."""
+
+    mesh = UnitSquareMesh(3, 3)
+    fs = FunctionSpace(mesh, LagrangeElement(mesh.cell, degree))
+    f = Function(fs)
+    f.interpolate(lambda x: x[0] * x[1])
+
+    M = assemble_matrix(fs, mass=1.0, stiffness=0.0)
+
+    assert np.allclose(assemble_vector(fs, f), M @ f.values)
+
+
+@pytest.mark.parametrize('degree', range(1, 4))
+def test_sparsity_pattern_reuse(degree):
+    """Reassembly reuses the cached pattern and reproduces the COO result."""
+
+    mesh = UnitSquareMesh(3, 3)
+    fs = FunctionSpace(mesh, LagrangeElement(mesh.cell, degree))
+
+    A = assemble_matrix(fs, mass=1.0, stiffness=0.0)
+    B = assemble_matrix(fs, mass=0.0, stiffness=1.0)
+
+    pattern = fs.sparsity()
+    assert pattern is fs.sparsity(fs)
+    assert pattern.assembly_count == 2
+    assert pattern.time_saved >= 0.0
+
+    local = local_matrices(fs, mass=1.0, stiffness=0.0)
+    n = fs.element.node_count
+    rows = np.repeat(fs.cell_nodes, n, axis=1).ravel()
+    cols = np.tile(fs.cell_nodes, (1, n)).ravel()
+    C = sp.coo_matrix((local.ravel(), (rows, cols)),
+                      shape=A.shape).tocsr()
+
+    assert abs(A - C).max() < 1e-14
+    assert (B.indptr == A.indptr).all() and (B.indices == A.indices).all()
+
+
+def test_modified_matrix_does_not_corrupt_pattern():
+    """Editing the sparsity of an assembled matrix in place does not affect
+    later assemblies on the same pattern."""
+
+    mesh = UnitSquareMesh(4, 4)
+    fs = FunctionSpace(mesh, LagrangeElement(mesh.cell, 1))
+
+    A = assemble_matrix(fs, mass=0.0, stiffness=1.0)
+    expected = A.toarray()
+    A.eliminate_zeros()
+    A.data[:] = 0.0
+
+    B = assemble_matrix(fs, mass=0.0, stiffness=1.0)
+
+    assert np.allclose(B.toarray(), expected)
+
+
+@pytest.mark.parametrize('cell, degree',
+                         [(c, d)
+                          for c in (ReferenceInterval, ReferenceTriangle)
+                          for d in range(1, 5)])
+def test_reference_tensors(cell, degree):
+    """The reference tensors agree with direct quadrature."""
+
+    fe = LagrangeElement(cell, degree)
+    Q = gauss_quadrature(cell, 2 * degree)
+    phi = fe.tabulate(Q.points)
+    dphi = fe.tabulate(Q.points, grad=True)
+
+    assert np.allclose(fe.mass_matrix, (Q.weights * phi.T) @ phi)
+    for d in range(cell.dim):
+        assert np.allclose(fe.value_gradient_products[d],
+                           (Q.weights * phi.T) @ dphi[:, :, d])
+        for e in range(cell.dim):
+            assert np.allclose(fe.gradient_products[d, e],
+                               (Q.weights * dphi[:, :, d].T)
+                               @ dphi[:, :, e])
+
+    # Constants have zero gradient.
+    assert np.allclose(fe.gradient_products.sum(axis=-1), 0)
+    assert np.allclose(fe.value_gradient_products.sum(axis=-1), 0)
+
+
+if __name__ == '__main__':
+    import sys
+    pytest.main(sys.argv)
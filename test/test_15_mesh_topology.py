@@ -0,0 +1,127 @@
+'''Test the construction of the mesh topology.'''
+import pytest
+from fe_utils import Mesh, UnitSquareMesh, UnitIntervalMesh
+import numpy as np
+
+
+@pytest.mark.parametrize('n', (1, 2, 5))
+def test_euler_characteristic(n):
+    """A triangulated square has V - E + F = 1."""
+
+    m = UnitSquareMesh(n, n)
+
+    assert m.entity_counts[0] - m.entity_counts[1] + m.entity_counts[2] == 1
+
+
+@pytest.mark.parametrize('n', (1, 2, 5))
+def test_cell_edges(n):
+    """Local edge e of each cell joins the vertices other than vertex e."""
+
+    m = UnitSquareMesh(n, n)
+
+    for c in range(m.entity_counts[-1]):
+        for e in range(3):
+            assert (m.edge_vertices[m.cell_edges[c, e]]
+                    == np.delete(m.cell_vertices[c], e)).all()
+
+
+def test_edge_numbering_deterministic():
+
+    m1 = UnitSquareMesh(4, 3)
+    m2 = Mesh(m1.vertex_coords, m1.cell_vertices[:, ::-1])
+
+    assert (m1.edge_vertices == m2.edge_vertices).all()
+    assert (m1.cell_edges == m2.cell_edges).all()
+
+
+@pytest.mark.parametrize('diagonal', ('left', 'right', 'crossed'))
+def test_structured_square_mesh(diagonal):
+    """Every structured mesh covers the square with positively sized
+    triangles, and the closed form geometry matches the general one."""
+
+    m = UnitSquareMesh(4, 3, diagonal)
+    unstructured = Mesh(m.vertex_coords, m.cell_vertices)
+
+    assert m.structure["diagonal"] == diagonal
+    assert unstructured.structure is None
+    assert round(np.abs(m.jacobian_determinants).sum() / 2 - 1, 12) == 0
+    assert (np.abs(m.jacobian_determinants) > 0).all()
+    assert np.allclose(m.jacobians, unstructured.jacobians)
+    assert np.allclose(m.inverse_jacobian_transposes,
+                       unstructured.inverse_jacobian_transposes)
+
+
+def test_diagonal_direction():
+
+    right = UnitSquareMesh(1, 1, 'right')
+    left = UnitSquareMesh(1, 1, 'left')
+
+    def diagonal(m):
+        e, = [e for e in m.edge_vertices
+              if np.ptp(m.vertex_coords[e], axis=0).all()]
+        return m.vertex_coords[e]
+
+    assert np.allclose(np.sort(diagonal(right), axis=0), [[0, 0], [1, 1]])
+    assert np.allclose(diagonal(left).sum(axis=1), [1, 1])
+
+
+def reference_adjacency(m, dim1, dim2):
+    """The adjacency computed by comparing the vertices of every pair of
+    entities."""
+
+    def vertices(d, e):
+        return set(m.adjacency(d, 0)[e]) if d else {e}
+
+    if dim1 == dim2 == 0:
+        return [sorted(v for edge in m.adjacency(1, 0) if e in edge
+                       for v in edge if v != e)
+                for e in range(m.entity_counts[0])]
+    result = []
+    for e1 in range(m.entity_counts[dim1]):
+        v1 = vertices(dim1, e1)
+        if dim1 == dim2:
+            result.append([e2 for e2 in range(m.entity_counts[dim2])
+                           if e2 != e1
+                           and len(v1 & vertices(dim2, e2)) == dim1])
+        else:
+            result.append([e2 for e2 in range(m.entity_counts[dim2])
+                           if v1 <= vertices(dim2, e2)
+                           or vertices(dim2, e2) <= v1])
+    return result
+
+
+@pytest.mark.parametrize('m', (UnitIntervalMesh(4), UnitSquareMesh(3, 2),
+                               UnitSquareMesh(2, 2, "crossed")))
+def test_csr_adjacency(m):
+
+    for dim1 in range(m.dim + 1):
+        for dim2 in range(m.dim + 1):
+            offsets, indices = m.csr_adjacency(dim1, dim2)
+            assert offsets.dtype == indices.dtype == np.int32
+            assert len(offsets) == m.entity_counts[dim1] + 1
+            actual = [list(indices[offsets[e]:offsets[e + 1]])
+                      for e in range(m.entity_counts[dim1])]
+            if dim1 > dim2:
+                # Downward adjacency keeps the local ordering.
+                actual = [sorted(a) for a in actual]
+            assert actual == reference_adjacency(m, dim1, dim2), \
+                "Incorrect adjacency from dimension %d to %d" % (dim1, dim2)
+            assert m.csr_adjacency(dim1, dim2)[1] is indices
+
+
+def test_edge_cells():
+
+    m = UnitSquareMesh(3, 4)
+    edge_cells = m.edge_cells
+
+    assert edge_cells.shape == (m.entity_counts[1], 2)
+    assert (np.sort(np.flatnonzero(edge_cells[:, 1] == -1))
+            == np.sort(m.exterior_facets)).all()
+    for e, cells in enumerate(edge_cells):
+        for c in cells[cells >= 0]:
+            assert e in m.cell_edges[c]
+
+
+if __name__ == '__main__':
+    import sys
+    pytest.main(sys.argv)
@@ -0,0 +1,70 @@
+'''Test the global numbering of function spaces.'''
+import pytest
+from fe_utils import UnitSquareMesh, UnitIntervalMesh, \
+    FunctionSpace, LagrangeElement
+import numpy as np
+
+
+def reference_cell_nodes(mesh, element):
+    """Evaluate the global numbering formula one cell at a time."""
+
+    offsets = np.concatenate(
+        ([0], np.cumsum(element.nodes_per_entity * mesh.entity_counts)))
+    cell_nodes = np.zeros((mesh.entity_counts[-1], element.node_count), int)
+
+    for c in range(mesh.entity_counts[-1]):
+        for delta in range(mesh.dim + 1):
+            n = element.nodes_per_entity[delta]
+            if delta == mesh.dim:
+                entities = [c]
+            else:
+                entities = mesh.adjacency(mesh.dim, delta)[c]
+            for epsilon, i in enumerate(entities):
+                cell_nodes[c, element.entity_nodes[delta][epsilon]] = \
+                    offsets[delta] + i * n + np.arange(n)
+
+    return cell_nodes
+
+
+@pytest.mark.parametrize('degree, mesh',
+                         [(d, m)
+                          for d in range(1, 6)
+                          for m in (UnitIntervalMesh(3),
+                                    UnitSquareMesh(3, 2))])
+def test_cell_nodes(degree, mesh):
+
+    fe = LagrangeElement(mesh.cell, degree)
+    fs = FunctionSpace(mesh, fe)
+
+    assert fs.cell_nodes.dtype == np.int32
+    assert fs.cell_nodes.flags.c_contiguous
+    assert (fs.cell_nodes == reference_cell_nodes(mesh, fe)).all()
+    assert (np.unique(fs.cell_nodes) == np.arange(fs.node_count)).all()
+
+
+@pytest.mark.parametrize('degree, mesh',
+                         [(d, m)
+                          for d in range(1, 5)
+                          for m in (UnitIntervalMesh(3),
+                                    UnitSquareMesh(3, 2))])
+def test_node_coordinates(degree, mesh):
+    """Every cell maps its reference nodes onto the coordinates of its
+    global nodes, so shared nodes agree between neighbouring cells."""
+
+    fe = LagrangeElement(mesh.cell, degree)
+    fs = FunctionSpace(mesh, fe)
+
+    assert mesh.coordinate_space is mesh.coordinate_space
+    assert fs.node_coordinates is fs.node_coordinates
+
+    cg1 = mesh.coordinate_space.element
+    coord_map = cg1.tabulate(fe.nodes)
+    for c in range(mesh.entity_counts[-1]):
+        vertices = mesh.vertex_coords[mesh.cell_vertices[c]]
+        assert np.allclose(fs.node_coordinates[fs.cell_nodes[c]],
+                           coord_map @ vertices)
+
+
+if __name__ == '__main__':
+    import sys
+    pytest.main(sys.argv)
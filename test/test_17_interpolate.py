@@ -0,0 +1,67 @@
+'''Test the evaluation of Python functions at arrays of points.'''
+import pytest
+from fe_utils import UnitSquareMesh, FunctionSpace, LagrangeElement, \
+    Function, ReferenceTriangle
+from fe_utils.utils import evaluate_at_points
+import numpy as np
+import math
+
+
+points = np.random.default_rng(0).random((7, 2))
+expected = np.sin(points[:, 0]) * points[:, 1]
+
+
+@pytest.mark.parametrize('fn', [
+    lambda x: np.sin(x[0]) * x[1],
+    lambda x: np.sin(x[:, 0]) * x[:, 1],
+    lambda x: math.sin(x[0]) * x[1],
+    lambda x: np.sin(x[0]) * x[1] if x[0] >= 0 else 0.,
+])
+def test_evaluate_at_points(fn):
+
+    assert np.allclose(evaluate_at_points(fn, points), expected)
+
+
+def test_evaluate_vector_values():
+
+    values = evaluate_at_points(lambda x: np.stack((x[0], 2 * x[1]), -1),
+                                points)
+
+    assert values.shape == (7, 2)
+    assert np.allclose(values, points * [1, 2])
+
+
+@pytest.mark.parametrize('fn', [lambda X: X[:, 0] + 2 * X[:, 1],
+                                lambda X: X[..., 0] + 2 * X[..., 1],
+                                lambda X: X[0] + 2 * X[1]])
+def test_evaluate_as_many_points_as_dimensions(fn):
+    """With two points in 2D, the column and row layouts of the points have
+    the same shape, which must not confuse the evaluation."""
+
+    points = np.array([[.1, .7], [.3, .2]])
+
+    assert np.allclose(evaluate_at_points(fn, points), [1.5, 0.7])
+
+
+def test_interpolate_matches_pointwise():
+
+    mesh = UnitSquareMesh(3, 3)
+    fs = FunctionSpace(mesh, LagrangeElement(mesh.cell, 3))
+    f = Function(fs)
+    f.interpolate(lambda x: np.cos(x[0]) * x[1]**2)
+
+    assert np.allclose(f.values, [math.cos(x[0]) * x[1]**2
+                                  for x in fs.node_coordinates])
+
+
+def test_element_interpolate():
+
+    fe = LagrangeElement(ReferenceTriangle, 2)
+
+    assert np.allclose(fe.interpolate(lambda x: x[0] + x[1]),
+                       fe.nodes.sum(axis=1))
+
+
+if __name__ == '__main__':
+    import sys
+    pytest.main(sys.argv)
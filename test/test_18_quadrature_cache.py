@@ -0,0 +1,50 @@
+'''Test the caching of quadrature rules.'''
+import pytest
+from fe_utils import gauss_quadrature, ReferenceTriangle, ReferenceInterval
+
+
+@pytest.mark.parametrize('cell', (ReferenceInterval, ReferenceTriangle))
+def test_rule_is_cached(cell):
+
+    q = gauss_quadrature(cell, 5)
+    hits = gauss_quadrature.cache_info().hits
+
+    assert gauss_quadrature(cell, 5) is q
+    assert gauss_quadrature.cache_info().hits == hits + 1
+
+
+@pytest.mark.parametrize('cell', (ReferenceInterval, ReferenceTriangle))
+def test_rule_cache_normalises_arguments(cell):
+
+    q = gauss_quadrature(cell, 3)
+
+    assert gauss_quadrature(cell, 3, "gauss") is q
+    assert gauss_quadrature(cell, degree=3) is q
+    assert gauss_quadrature(cell, 3, family="gauss") is q
+
+
+@pytest.mark.parametrize('cell', (ReferenceInterval, ReferenceTriangle))
+def test_rule_is_read_only(cell):
+
+    q = gauss_quadrature(cell, 3)
+
+    with pytest.raises(ValueError):
+        q.points[0] = 0.
+    with pytest.raises(ValueError):
+        q.weights[0] = 0.
+
+
+@pytest.mark.parametrize('degree', range(8))
+def test_triangle_rule_weights(degree):
+    """The weights sum to the area of the triangle and all points lie
+    inside it."""
+
+    q = gauss_quadrature(ReferenceTriangle, degree)
+
+    assert round(q.weights.sum() - 0.5, 14) == 0
+    assert (q.points > 0).all() and (q.points.sum(axis=1) < 1).all()
+
+
+if __name__ == '__main__':
+    import sys
+    pytest.main(sys.argv)
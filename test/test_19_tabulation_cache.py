@@ -0,0 +1,43 @@
+'''Test the caching of basis function tabulations.'''
+import pytest
+from fe_utils import LagrangeElement, ReferenceTriangle, ReferenceInterval
+import numpy as np
+
+
+@pytest.mark.parametrize('cell', (ReferenceInterval, ReferenceTriangle))
+def test_tabulation_is_cached(cell):
+
+    fe = LagrangeElement(cell, 3)
+    points = np.random.default_rng(0).random((5, cell.dim))
+
+    t = fe.tabulate(points)
+    dt = fe.tabulate(points, grad=True)
+
+    assert fe.tabulate(points.copy()) is t
+    assert fe.tabulate(points, grad=True) is dt
+    assert fe.tabulation_cache.stats()["hits"] == 2
+    assert fe.tabulation_cache.stats()["misses"] == 2
+    assert not t.flags.writeable
+
+
+def test_tabulation_cache_memory_cap():
+
+    fe = LagrangeElement(ReferenceTriangle, 2)
+    points = np.random.default_rng(0).random((3, 10, 2))
+    # Room for two tables of 10 points by 6 nodes.
+    fe.tabulation_cache.max_bytes = 2 * 10 * 6 * 8
+
+    tables = [fe.tabulate(p) for p in points]
+
+    stats = fe.tabulation_cache.stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+    assert stats["nbytes"] <= stats["max_bytes"]
+    assert fe.tabulate(points[2]) is tables[2]
+    assert np.allclose(fe.tabulate(points[0]), tables[0])
+    assert fe.tabulation_cache.stats()["misses"] == 4
+
+
+if __name__ == '__main__':
+    import sys
+    pytest.main(sys.argv)
@@ -0,0 +1,54 @@
+'''Test the orthonormal prime basis.'''
+import pytest
+from fe_utils import ReferenceTriangle, ReferenceInterval, LagrangeElement, \
+    gauss_quadrature
+from fe_utils.finite_elements import vandermonde_matrix
+import numpy as np
+
+
+@pytest.mark.parametrize('cell, degree',
+                         [(c, d)
+                          for c in (ReferenceInterval, ReferenceTriangle)
+                          for d in range(8)])
+def test_orthonormality(cell, degree):
+
+    q = gauss_quadrature(cell, 2 * degree)
+    V = vandermonde_matrix(cell, degree, q.points, basis="orthonormal")
+
+    assert V.shape == vandermonde_matrix(cell, degree, q.points).shape
+    assert np.allclose(V.T @ (q.weights[:, np.newaxis] * V),
+                       np.eye(V.shape[1]))
+
+
+@pytest.mark.parametrize('cell, degree',
+                         [(c, d)
+                          for c in (ReferenceInterval, ReferenceTriangle)
+                          for d in range(1, 8)])
+def test_orthonormal_gradient(cell, degree):
+    """Compare the gradient with a centred difference."""
+
+    x = np.random.default_rng(0).random((4, cell.dim)) / cell.dim
+    h = 1.e-6
+
+    dV = vandermonde_matrix(cell, degree, x, grad=True, basis="orthonormal")
+    fd = np.stack([(vandermonde_matrix(cell, degree, x + h * e,
+                                       basis="orthonormal")
+                    - vandermonde_matrix(cell, degree, x - h * e,
+                                         basis="orthonormal")) / (2 * h)
+                   for e in np.eye(cell.dim)], axis=-1)
+
+    assert np.allclose(dV, fd, atol=1.e-6 * np.abs(dV).max())
+
+
+@pytest.mark.parametrize('cell', (ReferenceInterval, ReferenceTriangle))
+def test_high_degree_tabulate_at_nodes(cell):
+
+    fe = LagrangeElement(cell, 15, basis="orthonormal")
+
+    assert np.allclose(fe.tabulate(fe.nodes), np.eye(fe.node_count),
+                       atol=1.e-10)
+
+
+if __name__ == '__main__':
+    import sys
+    pytest.main(sys.argv)
@@ -0,0 +1,50 @@
+'''Test the power table evaluation of the monomial Vandermonde matrix.'''
+import pytest
+from fe_utils import ReferenceTriangle, ReferenceInterval
+from fe_utils.finite_elements import vandermonde_matrix
+import numpy as np
+
+
+def monomials(cell, degree):
+    if cell is ReferenceInterval:
+        return [(n,) for n in range(degree + 1)]
+    else:
+        return [(d - p, p) for d in range(degree + 1) for p in range(d + 1)]
+
+
+@pytest.mark.parametrize('cell, degree',
+                         [(c, d)
+                          for c in (ReferenceInterval, ReferenceTriangle)
+                          for d in range(9)])
+def test_values_and_gradients(cell, degree):
+
+    x = np.random.default_rng(degree).random((6, cell.dim))
+
+    V = vandermonde_matrix(cell, degree, x)
+    dV = vandermonde_matrix(cell, degree, x, grad=True)
+
+    for j, n in enumerate(monomials(cell, degree)):
+        n = np.array(n)
+        assert np.allclose(V[:, j], np.prod(x**n, axis=1))
+        for i in range(cell.dim):
+            dn = n - np.eye(cell.dim, dtype=int)[i]
+            assert np.allclose(dV[:, j, i],
+                               n[i] * np.prod(x**np.maximum(dn, 0), axis=1))
+
+
+@pytest.mark.parametrize('cell', (ReferenceInterval, ReferenceTriangle))
+def test_single_precision(cell):
+
+    x = np.random.default_rng(0).random((6, cell.dim))
+
+    for grad in (False, True):
+        V = vandermonde_matrix(cell, 4, x, grad=grad, dtype=np.float32)
+
+        assert V.dtype == np.float32
+        assert np.allclose(V, vandermonde_matrix(cell, 4, x, grad=grad),
+                           atol=1.e-6)
+
+
+if __name__ == '__main__':
+    import sys
+    pytest.main(sys.argv)
@@ -0,0 +1,71 @@
+'''Test the Gauss-Lobatto-Legendre and warp and blend Lagrange nodes.'''
+import pytest
+from fe_utils import ReferenceTriangle, ReferenceInterval, LagrangeElement
+from fe_utils.finite_elements import lagrange_points
+from numpy.polynomial import legendre
+from test.test_08_entity_nodes import point_in_entity
+import numpy as np
+
+
+def gll_points(degree):
+    """The interior Gauss-Lobatto-Legendre points on [0, 1]."""
+    return (legendre.Legendre.basis(degree).deriv().roots() + 1) / 2
+
+
+@pytest.mark.parametrize('degree', range(1, 12))
+def test_interval_gll(degree):
+
+    p = lagrange_points(ReferenceInterval, degree, "gll")
+
+    assert (p[:2] == ReferenceInterval.vertices).all()
+    assert np.allclose(p[2:, 0], gll_points(degree))
+
+
+@pytest.mark.parametrize('degree', range(1, 12))
+def test_triangle_edges_gll(degree):
+    """The vertices are exact and the edge nodes are the GLL points in edge
+    order."""
+
+    fe = LagrangeElement(ReferenceTriangle, degree, "gll")
+    cell = ReferenceTriangle
+
+    assert (fe.nodes[:3] == cell.vertices).all()
+    for e, nodes in fe.entity_nodes[1].items():
+        v0, v1 = cell.vertices[cell.topology[1][e]]
+        t = gll_points(degree)[:, np.newaxis]
+        assert np.allclose(fe.nodes[nodes], v0 + t * (v1 - v0))
+
+
+@pytest.mark.parametrize('cell, degree',
+                         [(c, d)
+                          for c in (ReferenceInterval, ReferenceTriangle)
+                          for d in range(1, 12)])
+def test_nodes_on_correct_entity(cell, degree):
+
+    fe = LagrangeElement(cell, degree, "gll")
+
+    assert len(fe.nodes) == len(lagrange_points(cell, degree))
+    for d in range(cell.dim + 1):
+        for e, nodes in fe.entity_nodes[d].items():
+            for n in nodes:
+                assert point_in_entity(cell, fe.nodes[n], (d, e))
+
+
+@pytest.mark.parametrize('cell', (ReferenceInterval, ReferenceTriangle))
+def test_lebesgue_constant(cell):
+    """GLL based nodes interpolate far more stably at high degree."""
+
+    x = np.random.default_rng(0).random((4000, cell.dim))
+    x = x[x.sum(axis=1) < 1]
+
+    def lebesgue(variant):
+        fe = LagrangeElement(cell, 12, variant, basis="orthonormal")
+        return np.abs(fe.tabulate(x)).sum(axis=1).max()
+
+    assert lebesgue("gll") < 15
+    assert lebesgue("gll") < lebesgue("equispaced") / 10
+
+
+if __name__ == '__main__':
+    import sys
+    pytest.main(sys.argv)
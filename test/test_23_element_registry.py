@@ -0,0 +1,88 @@
+'''Test the shared Lagrange element registry and its on-disk cache.'''
+import pytest
+from fe_utils import ReferenceTriangle, ReferenceInterval, LagrangeElement
+import numpy as np
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(LagrangeElement, "_registry", {})
+    monkeypatch.setattr(LagrangeElement, "cache_dir", str(tmp_path))
+    return tmp_path
+
+
+@pytest.mark.parametrize('cell', (ReferenceInterval, ReferenceTriangle))
+def test_get_is_shared(cell):
+
+    fe = LagrangeElement.get(cell, 3)
+
+    assert LagrangeElement.get(cell, 3) is fe
+    assert LagrangeElement.get(cell, 3, "gll") is not fe
+    assert LagrangeElement.get(cell, 3, basis="orthonormal") is not fe
+
+
+def test_get_is_read_only():
+
+    fe = LagrangeElement.get(ReferenceTriangle, 2)
+
+    with pytest.raises(ValueError):
+        fe.basis_coefs[0, 0] = 1.
+    with pytest.raises(ValueError):
+        fe.nodes[0, 0] = 1.
+
+
+def test_get_matches_constructor():
+
+    fe = LagrangeElement.get(ReferenceTriangle, 4, "gll")
+    ref = LagrangeElement(ReferenceTriangle, 4, "gll")
+
+    assert (fe.nodes == ref.nodes).all()
+    assert fe.entity_nodes == ref.entity_nodes
+    assert np.allclose(fe.basis_coefs, ref.basis_coefs)
+
+
+def test_disk_cache(cache_dir):
+
+    fe = LagrangeElement.get(ReferenceTriangle, 5)
+    files = list(cache_dir.iterdir())
+    assert [f.name for f in files] == [
+        "ReferenceTriangle_5_equispaced_monomial.npz"
+    ]
+
+    # A new process has an empty registry but finds the file.
+    LagrangeElement._registry.clear()
+    with np.load(files[0]) as data:
+        coefs = data["basis_coefs"] + 1.
+        np.savez(files[0], nodes=data["nodes"], basis_coefs=coefs)
+
+    assert (LagrangeElement.get(ReferenceTriangle, 5).basis_coefs
+            == fe.basis_coefs + 1.).all()
+
+
+def test_disk_cache_rejects_corrupt_file(cache_dir):
+
+    filename = "ReferenceTriangle_2_equispaced_monomial.npz"
+    (cache_dir / filename).write_bytes(b"junk")
+
+    fe = LagrangeElement.get(ReferenceTriangle, 2)
+
+    assert np.allclose(fe.tabulate(fe.nodes), np.eye(fe.node_count))
+
+
+def test_disk_cache_unwritable(cache_dir, monkeypatch):
+    """A cache directory which cannot be created does not stop the element
+    being built."""
+
+    (cache_dir / "afile").write_bytes(b"")
+    monkeypatch.setattr(LagrangeElement, "cache_dir",
+                        str(cache_dir / "afile" / "sub"))
+
+    fe = LagrangeElement.get(ReferenceTriangle, 2)
+
+    assert np.allclose(fe.tabulate(fe.nodes), np.eye(fe.node_count))
+    assert [f.name for f in cache_dir.iterdir()] == ["afile"]
+
+
+if __name__ == '__main__':
+    import sys
+    pytest.main(sys.argv)
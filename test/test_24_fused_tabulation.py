@@ -0,0 +1,71 @@
+'''Test the fused tabulation of basis functions and their derivatives.'''
+import pytest
+from fe_utils import ReferenceTriangle, ReferenceInterval, LagrangeElement
+from fe_utils.finite_elements import vandermonde_derivatives, \
+    vandermonde_matrix
+import numpy as np
+import tracemalloc
+
+cases = [(c, d, b)
+         for c in (ReferenceInterval, ReferenceTriangle)
+         for d in range(0, 6)
+         for b in ("monomial", "orthonormal")]
+
+
+@pytest.mark.parametrize('cell, degree, basis', cases)
+def test_vandermonde_derivatives(cell, degree, basis):
+    """Each derivative is the finite difference of the one before."""
+
+    x = np.random.default_rng(0).random((20, cell.dim)) / cell.dim
+    V, dV, d2V = vandermonde_derivatives(cell, degree, x, 2, basis)
+
+    assert np.allclose(V, vandermonde_matrix(cell, degree, x, basis=basis))
+    assert np.allclose(dV, vandermonde_matrix(cell, degree, x, grad=True,
+                                              basis=basis))
+    assert d2V.shape == dV.shape + (cell.dim,)
+
+    h = 1e-6
+    for e in range(cell.dim):
+        dx = h * np.eye(cell.dim)[e]
+        _, dVp = vandermonde_derivatives(cell, degree, x + dx, 1, basis)
+        _, dVm = vandermonde_derivatives(cell, degree, x - dx, 1, basis)
+        assert np.allclose((dVp - dVm) / (2 * h), d2V[..., e], atol=1e-5)
+
+
+@pytest.mark.parametrize('cell, degree, basis', cases)
+def test_tabulate_all(cell, degree, basis):
+
+    fe = LagrangeElement(cell, max(degree, 1), basis=basis)
+    x = np.random.default_rng(1).random((7, cell.dim)) / cell.dim
+
+    phi, dphi = fe.tabulate_all(x)
+
+    assert np.allclose(phi, fe.tabulate(x))
+    assert np.allclose(dphi, fe.tabulate(x, grad=True))
+    assert fe.tabulate_all(x)[1] is dphi, "Tabulation not cached"
+
+
+def test_tabulate_all_repeat_allocates_nothing():
+    """Repeated tabulation at the same points returns the cached arrays
+    rather than allocating new ones."""
+
+    fe = LagrangeElement(ReferenceTriangle, 5)
+    x = np.random.default_rng(2).random((200, 2)) / 2
+    tables = fe.tabulate_all(x, hessian=True)
+    nbytes = sum(t.nbytes for t in tables)
+
+    tracemalloc.start()
+    try:
+        for _ in range(10):
+            fe.tabulate_all(x, hessian=True)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # Only the cache key, a copy of the points, is allocated.
+    assert peak < x.nbytes + 4096 < nbytes / 10
+
+
+if __name__ == '__main__':
+    import sys
+    pytest.main(sys.argv)
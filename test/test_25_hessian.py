@@ -0,0 +1,64 @@
+'''Test the tabulation of Hessians and the Laplacian of a Function.'''
+import pytest
+from fe_utils import ReferenceTriangle, ReferenceInterval, LagrangeElement, \
+    UnitSquareMesh, UnitIntervalMesh, FunctionSpace, Function
+import numpy as np
+
+
+@pytest.mark.parametrize('cell, degree, basis',
+                         [(c, d, b)
+                          for c in (ReferenceInterval, ReferenceTriangle)
+                          for d in range(1, 6)
+                          for b in ("monomial", "orthonormal")])
+def test_tabulate_hessian(cell, degree, basis):
+
+    fe = LagrangeElement(cell, degree, basis=basis)
+    x = np.random.default_rng(0).random((9, cell.dim)) / cell.dim
+
+    H = fe.tabulate(x, hessian=True)
+
+    assert H.shape == (9, fe.node_count, cell.dim, cell.dim)
+    assert np.allclose(H, H.transpose((0, 1, 3, 2)))
+    assert np.allclose(H, fe.tabulate_all(x, hessian=True)[2])
+    assert fe.tabulate(x, hessian=True) is H, "Hessian not cached"
+
+    h = 1e-6
+    for e in range(cell.dim):
+        dx = h * np.eye(cell.dim)[e]
+        fd = (fe._tabulate(x + dx, 1) - fe._tabulate(x - dx, 1)) / (2 * h)
+        assert np.allclose(fd, H[..., e], atol=1e-5)
+
+
+def test_tabulate_grad_and_hessian():
+
+    fe = LagrangeElement(ReferenceTriangle, 2)
+
+    with pytest.raises(ValueError):
+        fe.tabulate(fe.nodes, grad=True, hessian=True)
+
+
+@pytest.mark.parametrize('mesh, fn, laplacian',
+                         [(UnitIntervalMesh(4),
+                           lambda x: x[0]**3 - x[0],
+                           lambda x: 6 * x[0]),
+                          (UnitSquareMesh(3, 2),
+                           lambda x: x[0]**3 + 2 * x[0] * x[1]**2 - x[1]**2,
+                           lambda x: 10 * x[0] - 2)])
+def test_function_laplacian(mesh, fn, laplacian):
+    """The Laplacian of an interpolated cubic is exact."""
+
+    fs = FunctionSpace(mesh, LagrangeElement(mesh.cell, 3))
+    f = Function(fs)
+    f.interpolate(fn)
+    X = np.random.default_rng(1).random((5, mesh.dim)) / mesh.dim
+
+    cs = mesh.coordinate_space
+    x = np.einsum("pv,cvd->cpd", cs.element.tabulate(X),
+                  mesh.vertex_coords[cs.cell_nodes])
+
+    assert np.allclose(f.laplacian(X), laplacian(x.transpose((2, 0, 1))))
+
+
+if __name__ == '__main__':
+    import sys
+    pytest.main(sys.argv)
@@ -0,0 +1,37 @@
+'''Test the per-cell integrals of a function.'''
+import pytest
+from fe_utils import UnitSquareMesh, UnitIntervalMesh, \
+    FunctionSpace, LagrangeElement, Function
+import numpy as np
+
+
+@pytest.mark.parametrize('degree', range(1, 5))
+def test_integrate_cellwise_interval(degree):
+
+    mesh = UnitIntervalMesh(5)
+    f = Function(FunctionSpace(mesh, LagrangeElement(mesh.cell, degree)))
+    f.interpolate(lambda x: x[0]**degree)
+
+    integrals = f.integrate(cellwise=True)
+
+    x = mesh.vertex_coords[mesh.cell_vertices, 0]
+    exact = np.diff(x**(degree + 1), axis=1)[:, 0] / (degree + 1)
+    assert np.allclose(integrals, exact)
+
+
+@pytest.mark.parametrize('degree', range(1, 5))
+def test_integrate_cellwise_sum(degree):
+
+    mesh = UnitSquareMesh(4, 3)
+    f = Function(FunctionSpace(mesh, LagrangeElement(mesh.cell, degree)))
+    f.interpolate(lambda x: np.cos(x[0]) * x[1])
+
+    integrals = f.integrate(cellwise=True)
+
+    assert integrals.shape == (mesh.entity_counts[-1],)
+    assert np.isclose(integrals.sum(), f.integrate())
+
+
+if __name__ == '__main__':
+    import sys
+    pytest.main(sys.argv)
@@ -0,0 +1,96 @@
+'''Test the L2 and H1 error norms.'''
+import pytest
+from fe_utils import UnitSquareMesh, UnitIntervalMesh, \
+    FunctionSpace, LagrangeElement, Function, errornorm
+from fe_utils.utils import evaluate_at_points
+import numpy as np
+
+
+def exact(x):
+    return np.sin(np.pi * x[0]) * np.cos(x[-1])
+
+
+def exact_gradient(x):
+    g = [np.pi * np.cos(np.pi * x[0]) * np.cos(x[-1]),
+         -np.sin(np.pi * x[0]) * np.sin(x[-1])]
+    return np.array([g[0] + g[1]] if len(x) == 1 else g)
+
+
+def interpolant(mesh, degree):
+    f = Function(FunctionSpace(mesh, LagrangeElement(mesh.cell, degree)))
+    f.interpolate(exact)
+    return f
+
+
+@pytest.mark.parametrize('mesh', (UnitIntervalMesh(5), UnitSquareMesh(3, 4)))
+def test_errornorm_functions(mesh):
+    """Two functions which differ by a constant are that constant apart."""
+
+    f1 = interpolant(mesh, 2)
+    f2 = interpolant(mesh, 3)
+    f2.values += 0.5
+
+    assert np.isclose(errornorm(f1, f1), 0)
+    assert np.isclose(errornorm(interpolant(mesh, 3), f2, "H10"), 0)
+    assert np.isclose(errornorm(interpolant(mesh, 3), f2), 0.5)
+    assert np.isclose(errornorm(interpolant(mesh, 3), f2, "H1"), 0.5)
+
+
+@pytest.mark.parametrize('dim, degree',
+                         [(d, p) for d in (1, 2) for p in (1, 2, 3)])
+def test_errornorm_convergence(dim, degree):
+    """The error against the analytic solution converges at the optimal
+    rate in each norm."""
+
+    errors = []
+    for n in (8, 16):
+        mesh = UnitIntervalMesh(n) if dim == 1 else UnitSquareMesh(n, n)
+        f = interpolant(mesh, degree)
+        errors.append([errornorm(f, exact, norm, gradient=exact_gradient)
+                       for norm in ("L2", "H10", "H1")])
+
+    rates = np.log2(np.divide(*errors))
+    assert np.allclose(rates, [degree + 1, degree, degree], atol=0.2)
+
+    L2, H10, H1 = errors[-1]
+    assert np.isclose(H1**2, L2**2 + H10**2)
+
+
+def test_errornorm_symmetric():
+
+    f = interpolant(UnitSquareMesh(4, 4), 1)
+
+    assert np.isclose(errornorm(exact, f, "H1", gradient=exact_gradient),
+                      errornorm(f, exact, "H1", gradient=exact_gradient))
+
+
+def test_errornorm_errors():
+
+    f = interpolant(UnitIntervalMesh(2), 1)
+
+    with pytest.raises(ValueError):
+        errornorm(f, f, "H2")
+    with pytest.raises(ValueError):
+        errornorm(exact, exact)
+    with pytest.raises(ValueError):
+        errornorm(f, exact, "H1")
+
+
+def test_evaluate_vector_points_last():
+
+    calls = []
+
+    def fn(x):
+        calls.append(x)
+        return np.array([x[1], -x[0]])
+
+    points = np.random.default_rng(0).random((50, 2))
+    values = evaluate_at_points(fn, points)
+
+    assert np.allclose(values, points[:, ::-1] * [1, -1])
+    assert len(calls) == 3, "Vector valued function evaluated pointwise"
+
+
+if __name__ == '__main__':
+    import sys
+    pytest.main(sys.argv)
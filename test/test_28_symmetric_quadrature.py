@@ -0,0 +1,61 @@
+'''Test the fully symmetric triangle quadrature rules.'''
+import pytest
+from fe_utils import gauss_quadrature, ReferenceTriangle, ReferenceInterval
+from math import factorial
+import numpy as np
+
+
+@pytest.mark.parametrize('degree', range(14))
+def test_symmetric_exactness(degree):
+    """The rule integrates every monomial up to its degree exactly."""
+
+    q = gauss_quadrature(ReferenceTriangle, degree, "symmetric")
+
+    for i in range(degree + 1):
+        for j in range(degree + 1 - i):
+            numeric = np.dot(q.weights, q.points[:, 0]**i * q.points[:, 1]**j)
+            analytic = factorial(i) * factorial(j) / factorial(i + j + 2)
+            assert round(numeric - analytic, 14) == 0, \
+                "Degree %d rule fails on x**%d * y**%d" % (degree, i, j)
+
+
+@pytest.mark.parametrize('degree', range(13))
+def test_symmetric_points(degree):
+    """The weights are positive, the points are interior and the rule is
+    invariant under the symmetries of the triangle."""
+
+    q = gauss_quadrature(ReferenceTriangle, degree, "symmetric")
+    b = np.column_stack((q.points, 1 - q.points.sum(axis=1)))
+
+    assert (q.weights > 0).all()
+    assert (b > 0).all()
+
+    def key(bary, w):
+        return sorted(map(tuple, np.round(np.column_stack((bary, w)), 12)))
+
+    for perm in ((1, 2, 0), (1, 0, 2)):
+        assert key(b[:, perm], q.weights) == key(b, q.weights)
+
+
+@pytest.mark.parametrize('degree', [1, 2] + list(range(4, 13)))
+def test_symmetric_point_count(degree):
+
+    symmetric = gauss_quadrature(ReferenceTriangle, degree, "symmetric")
+    gauss = gauss_quadrature(ReferenceTriangle, degree)
+
+    assert len(symmetric.weights) < len(gauss.weights)
+
+
+def test_symmetric_fallback():
+
+    assert gauss_quadrature(ReferenceTriangle, 20, "symmetric") \
+        is gauss_quadrature(ReferenceTriangle, 20)
+    assert gauss_quadrature(ReferenceInterval, 5, "symmetric") \
+        is gauss_quadrature(ReferenceInterval, 5)
+    with pytest.raises(ValueError):
+        gauss_quadrature(ReferenceTriangle, 2, "newton-cotes")
+
+
+if __name__ == '__main__':
+    import sys
+    pytest.main(sys.argv)
@@ -0,0 +1,79 @@
+'''Test integration of batches of integrands and over batches of cells.'''
+import pytest
+from fe_utils import gauss_quadrature, ReferenceTriangle, ReferenceInterval, \
+    UnitSquareMesh, UnitIntervalMesh
+import numpy as np
+
+
+@pytest.mark.parametrize('cell', (ReferenceInterval, ReferenceTriangle))
+def test_integrate_array_valued(cell):
+    """All the monomial moments are integrated in one call."""
+
+    q = gauss_quadrature(cell, 6)
+    calls = []
+
+    def moments(x):
+        calls.append(x)
+        return np.array([x[0]**k for k in range(7)])
+
+    numeric = q.integrate(moments)
+
+    if cell is ReferenceInterval:
+        analytic = [1 / (k + 1) for k in range(7)]
+    else:
+        analytic = [1 / (k + 1) - 1 / (k + 2) for k in range(7)]
+    assert np.allclose(numeric, analytic)
+    assert len(calls) == 3, "Vectorised integrand evaluated pointwise"
+
+
+def test_integrate_returns_float():
+
+    q = gauss_quadrature(ReferenceTriangle, 2)
+
+    assert isinstance(q.integrate(lambda x: x[0] * x[1]), float)
+
+
+def test_integrate_as_many_points_as_dimensions():
+    """The degree 1 triangle rule has two points, so the column and row
+    layouts of its points have the same shape."""
+
+    q = gauss_quadrature(ReferenceTriangle, 1)
+    assert q.points.shape == (2, 2)
+
+    def stacked(X):
+        return np.stack([X[:, 0], X[:, 1]**2], 1)
+
+    pointwise = sum(w * np.array([x[0], x[1]**2])
+                    for x, w in zip(q.points, q.weights))
+
+    assert np.isclose(q.integrate(lambda X: X[:, 0]), 1 / 6)
+    assert np.allclose(q.integrate(stacked), pointwise)
+    assert np.isclose(q.integrate(stacked)[0], 1 / 6)
+
+
+@pytest.mark.parametrize('mesh', (UnitIntervalMesh(4), UnitSquareMesh(3, 2)))
+def test_integrate_affine(mesh):
+    """Integrating over the cells of a mesh agrees with the mesh
+    quadrature."""
+
+    q = gauss_quadrature(mesh.cell, 4)
+    origins = mesh.vertex_coords[mesh.cell_vertices[:, 0]]
+
+    def fn(x):
+        return np.array([np.ones_like(x[0]), x[0]**2 * x[-1]])
+
+    integrals = q.integrate_affine(fn, mesh.jacobians, origins)
+
+    assert integrals.shape == (mesh.entity_counts[-1], 2)
+    assert np.allclose(integrals[:, 0], q.weights.sum()
+                       * np.abs(mesh.jacobian_determinants))
+    x = mesh.quadrature_points(q)
+    assert np.allclose(integrals[:, 1],
+                       np.sum(mesh.quadrature_weights(q) * fn(x.T)[1].T,
+                              axis=1))
+    assert np.isclose(integrals[:, 1].sum(), 1 / 6 if mesh.dim == 2 else 1 / 4)
+
+
+if __name__ == '__main__':
+    import sys
+    pytest.main(sys.argv)
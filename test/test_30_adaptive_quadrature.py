@@ -0,0 +1,56 @@
+'''Test adaptive integration over the cells of a mesh.'''
+import pytest
+from fe_utils import gauss_quadrature, UnitSquareMesh, UnitIntervalMesh
+from fe_utils.quadrature import adaptive_integrate
+import numpy as np
+
+
+def peak(x):
+    """Oscillatory data with a sharp peak near one corner."""
+    return np.cos(4 * np.pi * x[0]) * x[-1]**2 \
+        + np.exp(-200 * ((x[0] - 0.9)**2 + (x[-1] - 0.9)**2))
+
+
+def reference(mesh, fn):
+    Q = gauss_quadrature(mesh.cell, 30)
+    x = mesh.quadrature_points(Q)
+    return np.sum(mesh.quadrature_weights(Q) * fn(x.T).T)
+
+
+@pytest.mark.parametrize('mesh', (UnitIntervalMesh(20), UnitSquareMesh(8, 8)))
+@pytest.mark.parametrize('tolerance', (1e-6, 1e-10))
+def test_adaptive_accuracy(mesh, tolerance):
+
+    integrals, errors, evaluations = adaptive_integrate(mesh, peak,
+                                                        tolerance)
+
+    assert abs(integrals.sum() - reference(mesh, peak)) < tolerance
+    assert errors.sum() < tolerance
+
+
+def test_adaptive_refines_locally():
+    """Only the cells near a sharp peak need high degree rules."""
+
+    mesh = UnitSquareMesh(8, 8)
+    n = mesh.entity_counts[-1]
+
+    def points(degree):
+        return len(gauss_quadrature(mesh.cell, degree, "symmetric").weights)
+
+    _, _, smooth = adaptive_integrate(mesh, lambda x: x[0] * x[1], 1e-6)
+    _, _, peaked = adaptive_integrate(
+        mesh,
+        lambda x: x[0] * x[1] + np.exp(-200 * ((x[0] - .9)**2
+                                               + (x[1] - .9)**2)),
+        1e-6)
+
+    # A quadratic is integrated exactly by the first rule, which the
+    # second confirms.
+    assert smooth == n * (points(2) + points(4))
+    # Not all of the cells need a third rule.
+    assert peaked < smooth + n * points(6)
+
+
+if __name__ == '__main__':
+    import sys
+    pytest.main(sys.argv)
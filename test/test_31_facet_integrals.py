@@ -0,0 +1,99 @@
+'''Test facet quadrature and the assembly of boundary integrals.'''
+import pytest
+from fe_utils import ReferenceTriangle, ReferenceInterval, UnitSquareMesh, \
+    UnitIntervalMesh, FunctionSpace, LagrangeElement
+from fe_utils.quadrature import facet_quadrature
+from fe_utils.assembly import assemble_exterior_facet_matrix, \
+    assemble_exterior_facet_vector, assemble_matrix, \
+    exterior_facet_measures, exterior_facet_local_matrices
+import numpy as np
+
+
+@pytest.mark.parametrize('facet', range(3))
+@pytest.mark.parametrize('degree', range(1, 6))
+def test_facet_quadrature_triangle(facet, degree):
+
+    q = facet_quadrature(ReferenceTriangle, facet, degree)
+    v0, v1 = ReferenceTriangle.vertices[ReferenceTriangle.topology[1][facet]]
+
+    # The points lie on the facet.
+    t = (q.points - v0) @ (v1 - v0) / np.dot(v1 - v0, v1 - v0)
+    assert np.allclose(q.points, v0 + np.outer(t, v1 - v0))
+    # Polynomials in the facet parameter are integrated exactly.
+    assert np.isclose(np.dot(q.weights, t**degree), 1 / (degree + 1))
+
+
+def test_facet_quadrature_interval():
+
+    for facet in range(2):
+        q = facet_quadrature(ReferenceInterval, facet, 3)
+        assert (q.points == ReferenceInterval.vertices[facet]).all()
+        assert (q.weights == 1).all()
+
+
+@pytest.mark.parametrize('nx, ny', [(1, 1), (3, 2), (4, 5)])
+def test_exterior_facets(nx, ny):
+
+    m = UnitSquareMesh(nx, ny)
+
+    assert len(m.exterior_facets) == 2 * (nx + ny)
+    assert (m.cell_edges[m.exterior_facet_cells,
+                         m.exterior_facet_local_facets]
+            == m.exterior_facets).all()
+
+    x = m.vertex_coords[m.edge_vertices[m.exterior_facets]].mean(axis=1)
+    assert np.allclose(np.abs(x - 0.5).max(axis=1), 0.5), \
+        "Exterior facet not on the boundary"
+
+    # The normals are outward unit vectors, and sum to zero around the
+    # closed boundary when weighted by the facet lengths.
+    n = m.exterior_facet_normals
+    centroids = m.vertex_coords[m.cell_vertices].mean(axis=1)
+    assert np.allclose(np.linalg.norm(n, axis=1), 1)
+    assert (np.sum(n * (x - centroids[m.exterior_facet_cells]), axis=1)
+            > 0).all()
+    assert np.allclose(exterior_facet_measures(m) @ n, 0)
+
+
+@pytest.mark.parametrize('degree', range(1, 4))
+def test_exterior_facet_matrix(degree):
+
+    m = UnitSquareMesh(4, 3)
+    fs = FunctionSpace(m, LagrangeElement(m.cell, degree))
+
+    A = assemble_exterior_facet_matrix(fs, coefficient=2.0)
+
+    assert exterior_facet_local_matrices(fs).shape \
+        == (len(m.exterior_facets),) + (fs.element.node_count,) * 2
+
+    assert np.isclose(A.sum(), 8.0), "Boundary mass is not twice perimeter"
+    assert (A.indices == assemble_matrix(fs).indices).all()
+
+
+@pytest.mark.parametrize('degree', range(1, 4))
+def test_exterior_facet_vector(degree):
+
+    m = UnitSquareMesh(3, 4)
+    fs = FunctionSpace(m, LagrangeElement(m.cell, degree))
+
+    b = assemble_exterior_facet_vector(fs, lambda x: x[0]**2 + x[1])
+
+    # The integral over the bottom, top, left and right sides.
+    assert np.isclose(b.sum(), 1 / 3 + 4 / 3 + 1 / 2 + 3 / 2)
+
+
+def test_exterior_facet_vector_interval():
+
+    m = UnitIntervalMesh(3)
+    fs = FunctionSpace(m, LagrangeElement(m.cell, 2))
+
+    b = assemble_exterior_facet_vector(fs, lambda x: 3 + x[0])
+
+    expected = np.zeros(fs.node_count)
+    expected[0], expected[3] = 3, 4
+    assert np.allclose(b, expected)
+
+
+if __name__ == '__main__':
+    import sys
+    pytest.main(sys.argv)